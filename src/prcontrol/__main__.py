@@ -1,10 +1,9 @@
-import contextlib
 import logging
+import logging.handlers
 import os
+import threading
 from typing import Never
 
-from tinkerforge.ip_connection import Error as TfIpError  # type: ignore
-
 from prcontrol.controller.controller import TfEndpoint
 from prcontrol.webapi.api import create_app
 
@@ -19,7 +18,29 @@ log_stdout.setFormatter(
     )
 )
 log_stdout.setLevel(logging.DEBUG)
-logging.basicConfig(handlers=[log_stdout])
+# Records are formatted and written in batches. Warnings and errors
+# flush the buffer immediately, so they are never delayed. Everything
+# else is written at least once per `_LOG_FLUSH_INTERVAL` seconds.
+log_buffer = logging.handlers.MemoryHandler(
+    capacity=1024,
+    flushLevel=logging.WARNING,
+    target=log_stdout,
+    flushOnClose=True,
+)
+logging.basicConfig(handlers=[log_buffer])
+
+_LOG_FLUSH_INTERVAL = 1.0
+_stop_log_flush = threading.Event()
+
+
+def _flush_log_periodically() -> None:
+    while not _stop_log_flush.wait(_LOG_FLUSH_INTERVAL):
+        log_buffer.flush()
+
+
+threading.Thread(
+    target=_flush_log_periodically, name="log-flush", daemon=True
+).start()
 
 
 def _error() -> Never:
@@ -61,10 +82,10 @@ if __name__ == "__main__":
     )
 
     try:
-        socketio.run(
-            app, debug=True, host="0.0.0.0", allow_unsafe_werkzeug=True
-        )
+        # No debug mode: the reloader would spawn a second process
+        # that opens its own connections to both boxes.
+        socketio.run(app, host="0.0.0.0", allow_unsafe_werkzeug=True)
     finally:
-        print("Shutting down")
-        with contextlib.suppress(TfIpError):
-            controller.power_box.reset_leds()
+        controller.shutdown()
+        _stop_log_flush.set()
+        log_buffer.flush()
@@ -6,7 +6,9 @@ from abc import ABC, abstractmethod
 from collections.abc import Callable, Iterable, Iterator
 from contextlib import contextmanager
 from enum import Enum
-from typing import Any
+from functools import cache
+from operator import attrgetter
+from typing import Any, NamedTuple
 
 import attrs
 from tinkerforge.bricklet_io16_v2 import BrickletIO16V2
@@ -35,28 +37,35 @@ class LedLane(Enum):
 
     def demux[T](self, val_1: T, val_2: T, val_3: T) -> T:
         """Helper method for matching values to lanes"""
-        if self == LedLane.LANE_1:
-            return val_1
-        elif self == LedLane.LANE_2:
-            return val_2
-        elif self == LedLane.LANE_3:
-            return val_3
-        raise RuntimeError(f"Invalid LedLane {self}")
+        return (val_1, val_2, val_3)[self.value]
 
 
-@attrs.frozen
-class LedPosition:
+class LedPosition(NamedTuple):
     lane: LedLane
     side: LedSide
 
     @staticmethod
     def led_iter() -> Iterable["LedPosition"]:
-        for lane in LedLane.LANE_1, LedLane.LANE_2, LedLane.LANE_3:
-            for side in LedSide.FRONT, LedSide.BACK:
-                yield LedPosition(lane, side)
+        return _ALL_LED_POSITIONS
+
+    @staticmethod
+    def of(lane: LedLane, side: LedSide) -> "LedPosition":
+        """The shared instance for `lane` and `side`.
+
+        Set and dict lookups with it succeed on identity,
+        without comparing the fields.
+        """
+        return _ALL_LED_POSITIONS[2 * lane.value + side.value]
+
+
+_ALL_LED_POSITIONS: tuple[LedPosition, ...] = tuple(
+    LedPosition(lane, side)
+    for lane in (LedLane.LANE_1, LedLane.LANE_2, LedLane.LANE_3)
+    for side in (LedSide.FRONT, LedSide.BACK)
+)
 
 
-@attrs.frozen
+@attrs.frozen(slots=True, cache_hash=True, weakref_slot=False)
 class _BrickletRepr[T: Device]:
     """Represents a future bricklet."""
 
@@ -104,6 +113,16 @@ class BrickletManager:
 
     ipcon: IPConnection
     bricklet_from_repr: dict[_BrickletRepr[Any], Device]
+    # Fields declared using bricklet(...), collected once per subclass
+    _bricklet_fields: tuple[tuple[str, _BrickletRepr[Any]], ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._bricklet_fields = tuple(
+            (field_name, value)
+            for field_name, value in vars(cls).items()
+            if isinstance(value, _BrickletRepr)
+        )
 
     def __init__(self, ip_connection: IPConnection) -> None:
         self.ipcon = ip_connection
@@ -111,10 +130,7 @@ class BrickletManager:
 
         # replace all fields declared using bricklet(...) with
         # their initialized bricklets
-        for field_name, value in vars(self.__class__).items():
-            if not isinstance(value, _BrickletRepr):
-                continue
-
+        for field_name, value in self._bricklet_fields:
             bricklet = value.kind(value.uid, ip_connection)
             self.bricklet_from_repr[value] = bricklet
             setattr(self, field_name, bricklet)
@@ -141,7 +157,7 @@ def establish_connection(
         logger.info("Connected.")
         yield
     finally:
-        logger.info("Disconnecting from {self.host}:{self.port}.")
+        logger.info(f"Disconnecting from {host}:{port}.")
         ipcon.disconnect()
 
 
@@ -152,20 +168,32 @@ class StatusLeds(ABC):
     """
 
     _bricklet: BrickletIO16V2
-    _blinking_io16_channels: dict[int, int]
+    # Last state set per channel, see `led`
+    _led_states: list[LedState]
+    # Blink period per channel, only meaningful where `_blink_mask` is set
+    _blink_period: list[int]
+    _blink_mask: int
+    _channel_directions: tuple[str, ...]
 
     def __init__(self, bricklet: BrickletIO16V2):
         super().__init__()
         self._bricklet = bricklet
-        self._blinking_io16_channels = dict()
+        self._led_states = [LedState.UNDEFINED] * 16
+        self._blink_period = [0] * 16
+        self._blink_mask = 0
+        self._channel_directions = tuple(
+            "i" if self.is_input_channel(channel) else "o"
+            for channel in range(16)
+        )
 
     def initialize(self) -> None:
         """Registers the necessary callbacks for blinking LEDs on IO bricklets
         Sets channels to input/output accorting to `is_output_channel`.
         """
 
-        for channel in range(16):
-            direction = "i" if self.is_input_channel(channel) else "o"
+        # The IO-16 V2 has no port-wide configuration, so this stays
+        # one (response-less) request per channel.
+        for channel, direction in enumerate(self._channel_directions):
             self._bricklet.set_configuration(channel, direction, True)
 
         self._bricklet.register_callback(
@@ -180,30 +208,19 @@ class StatusLeds(ABC):
         The field will automatically set the TinkerForge IO16-Led to the
         supplied value.
         """
-        value_box: list[LedState] = [LedState.UNDEFINED]  # use a list as a box
-
-        def _set_led(self: "StatusLeds", new_value: LedState) -> None:
-            if new_value == value_box[0]:
-                return
-            value_box[0] = new_value
-            if (
-                new_value == LedState.BLINK_SLOW
-                or new_value == LedState.BLINK_FAST
-            ):
-                self._blink_led(channel, new_value.value)
-            elif new_value == LedState.HIGH:
-                self._blink_stop_led(channel)
-                self._set_led(channel, True)
-            elif new_value == LedState.LOW:
-                self._blink_stop_led(channel)
-                self._set_led(channel, False)
-
-        def _get_led(_self: "StatusLeds") -> LedState:
-            return value_box[0]
-
         # type trickery: we lie about the return value
-        # because property attaches the necessary getters and setters
-        return property(_get_led, _set_led)  # type: ignore
+        # because the descriptor provides the necessary getters and setters
+        return _LedProperty(channel)  # type: ignore
+
+    def _apply_led(self, channel: int, new_value: LedState) -> None:
+        if new_value is LedState.BLINK_SLOW or new_value is LedState.BLINK_FAST:
+            self._blink_led(channel, new_value.value)
+        elif new_value is LedState.HIGH:
+            self._blink_stop_led(channel)
+            self._set_led(channel, True)
+        elif new_value is LedState.LOW:
+            self._blink_stop_led(channel)
+            self._set_led(channel, False)
 
     def is_input_channel(self, channel: int) -> bool:
         return not self.is_output_channel(channel)
@@ -214,24 +231,44 @@ class StatusLeds(ABC):
 
     def _callback_io_16_led_blink(self, channel: int, val: bool) -> None:
         """A monoflop callback for io16 that oscilates `channel_to_blink`"""
-        duration_ms = self._blinking_io16_channels.get(channel)
-        if duration_ms is None:
+        if not (self._blink_mask >> channel) & 1:
             return
-        self._bricklet.set_monoflop(channel, val, duration_ms)
+        self._bricklet.set_monoflop(channel, val, self._blink_period[channel])
 
     def _set_led(self, channel: int, value: bool) -> None:
-        assert self.is_output_channel(channel)
+        assert self._channel_directions[channel] == "o"
         self._bricklet.set_selected_value(channel, value)
 
     def _blink_led(self, channel: int, period_ms: int) -> None:
-        assert self.is_output_channel(channel)
-        self._blinking_io16_channels[channel] = period_ms
+        assert self._channel_directions[channel] == "o"
+        self._blink_period[channel] = period_ms
+        self._blink_mask |= 1 << channel
         # Bootstrap blinking
         self._callback_io_16_led_blink(channel, True)
 
     def _blink_stop_led(self, channel: int) -> None:
-        if channel in self._blinking_io16_channels:
-            self._blinking_io16_channels.pop(channel)
+        self._blink_mask &= ~(1 << channel)
+
+
+class _LedProperty:
+    """Descriptor behind `StatusLeds.led`, the state lives on the panel."""
+
+    __slots__ = ("channel",)
+
+    def __init__(self, channel: int) -> None:
+        self.channel = channel
+
+    def __get__(self, obj: StatusLeds | None, _owner: type) -> Any:
+        if obj is None:
+            return self
+        return obj._led_states[self.channel]
+
+    def __set__(self, obj: StatusLeds, new_value: LedState) -> None:
+        # Enum members are singletons, identity is enough
+        if new_value is obj._led_states[self.channel]:
+            return
+        obj._led_states[self.channel] = new_value
+        obj._apply_led(self.channel, new_value)
 
 
 type SensorObserver[T] = (
@@ -241,21 +278,48 @@ type SensorObserver[T] = (
 )
 
 
+@cache
+def _sensor_state_layout(
+    cls: type,
+) -> tuple[Callable[[Any], tuple[Any, ...]], dict[str, int]]:
+    """Getter for all values of a sensor state except `callback`
+    and the position of each field in its result.
+    """
+    names = tuple(a.name for a in attrs.fields(cls) if a.name != "callback")
+    return attrgetter(*names), {name: i for i, name in enumerate(names)}
+
+
+# `attrs.field(metadata=...)` of sensor state fields that are
+# dispatched even if the assigned value equals the current one
+DISPATCH_REPEATS = {"dispatch_repeats": True}
+
+
 def sensor_observer_callback_dispatcher(
     self: Any, attribute: "attrs.Attribute[Any]", value: Any
 ) -> Any:
     """Designed to be used as an attrs on_setattr hook.
     Dispatches the changed attributes to the observers
     as defined in the Attrs-Classes' `.callback` field.
+    Assigning a value equal to the current one does not dispatch,
+    unless the field has `DISPATCH_REPEATS` metadata.
+
+    All fields except `callback` must be positional `__init__` arguments.
     """
     if attribute.name != "callback" and hasattr(self, "callback"):
         cb = self.callback
-        if cb is not None:
-            evolved = attrs.evolve(
-                self, **{"callback": None, attribute.name: value}
-            )
-
-            if isinstance(cb, list):
+        # Most bricklets report periodically, mostly unchanged values.
+        # Observers only care about changes, so repeats are dropped here.
+        if cb is not None and (
+            getattr(self, attribute.name) != value
+            or "dispatch_repeats" in attribute.metadata
+        ):
+            cls: type = type(self)
+            get_values, index_of = _sensor_state_layout(cls)
+            values = list(get_values(self))
+            values[index_of[attribute.name]] = value
+            evolved = cls(*values)
+
+            if type(cb) is list:
                 for f in cb:
                     f(self, evolved, attribute, value)
             else:
@@ -1,11 +1,15 @@
 # This file contains the tools for managing and
 # loading stored configuration files
 
+import contextlib
 import logging
+import mmap
 import os
 import pathlib
-import re
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any
 
 from attrs import define, field
 
@@ -27,31 +31,43 @@ class ConfigFolder[T: ConfigObject]:
     kind: type[T]
 
     _configs: set[int] = field(init=False, factory=set)
-    _FILENAME_PATTERN = re.compile(r"obj_([0-9]+)\.json")
-
-    _uids: list[int] = []
-    _uids_initialized: bool = False
+    # Parsed objects by uid, together with the file's mtime when parsed
+    _cache: dict[int, tuple[int, T]] = field(init=False, factory=dict)
+    # Uids handed out by `next_uid` that may not be stored yet
+    _reserved_uids: set[int] = field(init=False, factory=set)
+    # `workspace` plus trailing separator, for building file paths cheaply
+    _workspace_str: str = field(init=False, default="")
+    _WRITE_BUFFER = 64 * 1024
+    _PARALLEL_LOAD_THRESHOLD = 4
+    _MMAP_THRESHOLD = 1024 * 1024
 
     def __attrs_post_init__(self) -> None:
         logger.debug(f"Initializing config folder at {self.workspace!r}")
         if not os.path.isdir(self.workspace):
             os.makedirs(self.workspace)
+        self._workspace_str = str(self.workspace) + os.sep
         self._update()
 
     def _update(self) -> None:
         """Helper Method: Update configuration files from disk.
         Runs only after Initilization!"""
         logger.debug(f"Reading config files in {self.workspace!r}")
-        for file_path in os.listdir(self.workspace):
-            _match = self._FILENAME_PATTERN.fullmatch(file_path)
-            if _match is None:
-                continue
-
-            id = int(_match.groups()[0])
-            self._configs.add(id)
-
-    def _path_of_uid(self, uid: int) -> pathlib.Path:
-        return self.workspace / f"obj_{uid}.json"
+        with os.scandir(self.workspace) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (
+                    name.startswith("obj_")
+                    and name.endswith(".json")
+                    and entry.is_file()
+                ):
+                    continue
+
+                id = name[4:-5]
+                if id.isascii() and id.isdigit():
+                    self._configs.add(int(id))
+
+    def _path_of_uid(self, uid: int) -> str:
+        return self._workspace_str + "obj_" + str(uid) + ".json"
 
     def load(self, uid: int) -> T:
         """Get configuration with given `uid`.
@@ -63,9 +79,29 @@ class ConfigFolder[T: ConfigObject]:
             raise FileNotFoundError(
                 "Config for {self.name} with uid {uid} not found."
             )
+        path = self._path_of_uid(uid)
+        stat = os.stat(path)
+        mtime = stat.st_mtime_ns
+        cached = self._cache.get(uid)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
         logger.debug(f"Loading uid {uid} from {self.workspace!r}")
-        with open(self._path_of_uid(uid)) as config:
-            return self.kind.from_json(config.read())
+        with open(path, "rb") as config:
+            if stat.st_size < self._MMAP_THRESHOLD:
+                config_object = self.kind.from_json(config.read())
+            else:
+                # Parse straight from the page cache instead of copying
+                # large files (experiments) into a bytes object first
+                with (
+                    mmap.mmap(
+                        config.fileno(), 0, access=mmap.ACCESS_READ
+                    ) as mapped,
+                    memoryview(mapped) as view,
+                ):
+                    config_object = self.kind.from_json(view)
+        self._cache[uid] = (mtime, config_object)
+        return config_object
 
     def add(self, config_object: T) -> None:
         """Store configuration under the uid `uid`.
@@ -76,10 +112,56 @@ class ConfigFolder[T: ConfigObject]:
             f"Adding object {config_object.get_description()}"
             f" to {self.workspace!r}"
         )
-        with open(path, "w") as file:
-            file.write(config_object.to_json())
+        with open(path, "wb") as file:
+            file.write(config_object.to_json_bytes())
 
             self._configs.add(config_object.get_uid())
+        self._cache.pop(config_object.get_uid(), None)
+
+    def add_many(self, config_objects: Iterable[T]) -> None:
+        """Store several configurations at once.
+        May overwrite existing `uid`s. Of several objects with the same
+        `uid`, the last one is stored.
+
+        Each object is written and synced to a temporary file first, then
+        moved into place atomically. The folder itself is synced once after
+        all moves. On failure, leftover temporary files are removed.
+        """
+        # One temporary file per uid, a repeated uid would reuse it
+        latest = {obj.get_uid(): obj for obj in config_objects}
+        written: list[tuple[str, str, int]] = []
+        try:
+            for uid, config_object in latest.items():
+                path = self._path_of_uid(uid)
+                tmp_path = path + ".tmp"
+                written.append((tmp_path, path, uid))
+                with open(tmp_path, "wb", buffering=self._WRITE_BUFFER) as file:
+                    file.write(config_object.to_json_bytes())
+                    file.flush()
+                    os.fsync(file.fileno())
+
+            logger.debug(f"Adding {len(written)} objects to {self.workspace!r}")
+            for tmp_path, path, uid in written:
+                os.replace(tmp_path, path)
+                self._configs.add(uid)
+                self._cache.pop(uid, None)
+        except BaseException:
+            # Files already moved into place are gone from their tmp path
+            for tmp_path, _, _ in written:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(tmp_path)
+            raise
+        self._fsync_workspace()
+
+    def _fsync_workspace(self) -> None:
+        """Makes renames in the workspace durable, where supported."""
+        if os.name != "posix":
+            return
+        fd = os.open(self.workspace, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
 
     def add_from_json(self, config_json: str | bytes | bytearray) -> None:
         """Store configuration under the uid `uid`.
@@ -91,13 +173,9 @@ class ConfigFolder[T: ConfigObject]:
 
     def next_uid(self) -> int:
         """Returns the next free UID and reserves it for runtime."""
-        if not self._uids_initialized:
-            for obj in self.load_all():
-                self._uids.append(obj.get_uid())
-        self._uids_initialized = True
-        max_uid = max(self._uids) if len(self._uids) > 0 else -1
-        self._uids.append(max_uid + 1)
-        return max_uid + 1
+        uid = max(self._configs | self._reserved_uids, default=-1) + 1
+        self._reserved_uids.add(uid)
+        return uid
 
     def delete(self, uid: int) -> None:
         """Delete configuration `id` if exists"""
@@ -105,32 +183,70 @@ class ConfigFolder[T: ConfigObject]:
         if uid in self._configs:
             os.remove(self._path_of_uid(uid))
             self._configs.remove(uid)
+            self._cache.pop(uid, None)
 
     def load_all(self) -> Iterable[ConfigObject]:
         logger.debug(f"Loading all objects from {self.workspace!r}")
-        for uid in self._configs:
-            yield self.load(uid)
+        # Read in uid order rather than set order, which keeps it stable
+        uids = sorted(self._configs)
+        if len(uids) < self._PARALLEL_LOAD_THRESHOLD:
+            for uid in uids:
+                yield self.load(uid)
+            return
+
+        # Files are independent, let the reads overlap
+        with ThreadPoolExecutor(max_workers=min(8, len(uids))) as executor:
+            yield from executor.map(self.load, uids)
 
 
 class ConfigManager:
-    leds: ConfigFolder[LED]
-    bricklets: ConfigFolder[TinkerforgeBricklet]
-    experiment_templates: ConfigFolder[ExperimentTemplate]
-    experiments: ConfigFolder[Experiment]
-    configs: ConfigFolder[HardwareConfig]
+    """Collection of all config folders below `base_path`.
+
+    Folders are created and scanned on first access only.
+    """
+
+    base_path: pathlib.Path
+    _folders: dict[str, ConfigFolder[Any]]
+    _folders_lock: Lock
 
     def __init__(self, base_path: str | pathlib.Path | None = None) -> None:
         logger.info(f"ConfigManager at {base_path!r}.")
         if base_path is None:
             base_path = "./workspace"
-        base_path = pathlib.Path(base_path)
-
-        self.leds = ConfigFolder(base_path / "leds", LED)
-        self.bricklets = ConfigFolder(
-            base_path / "bricklets", TinkerforgeBricklet
-        )
-        self.experiment_templates = ConfigFolder(
-            base_path / "exp_tmps", ExperimentTemplate
-        )
-        self.experiments = ConfigFolder(base_path / "experiments", Experiment)
-        self.configs = ConfigFolder(base_path / "configs", HardwareConfig)
+        self.base_path = pathlib.Path(base_path)
+        self._folders = dict()
+        # The web api and the Controller's persist thread may both
+        # open a folder first, each must end up with the same instance.
+        self._folders_lock = Lock()
+
+    def _folder[T: ConfigObject](
+        self, name: str, kind: type[T]
+    ) -> ConfigFolder[T]:
+        folder = self._folders.get(name)
+        if folder is None:
+            with self._folders_lock:
+                folder = self._folders.get(name)
+                if folder is None:
+                    folder = ConfigFolder(self.base_path / name, kind)
+                    self._folders[name] = folder
+        return folder
+
+    @property
+    def leds(self) -> ConfigFolder[LED]:
+        return self._folder("leds", LED)
+
+    @property
+    def bricklets(self) -> ConfigFolder[TinkerforgeBricklet]:
+        return self._folder("bricklets", TinkerforgeBricklet)
+
+    @property
+    def experiment_templates(self) -> ConfigFolder[ExperimentTemplate]:
+        return self._folder("exp_tmps", ExperimentTemplate)
+
+    @property
+    def experiments(self) -> ConfigFolder[Experiment]:
+        return self._folder("experiments", Experiment)
+
+    @property
+    def configs(self) -> ConfigFolder[HardwareConfig]:
+        return self._folder("configs", HardwareConfig)
@@ -1,23 +1,39 @@
 # This file contains all the attrs classes, which represent all the diffrent
 # JSON Files for hardware configuration of the reactor
 
-import json
+import sys
 from abc import ABC, abstractmethod
 
 import attrs
-from cattr import structure, unstructure
+import orjson
+from cattrs import Converter
+from cattrs.gen import make_dict_structure_fn, make_dict_unstructure_fn
+
+# Converter with hooks generated up front for every class in this module,
+# see the bottom of the file.
+_converter = Converter()
 
 
 class JSONSeriablizable:
+    # No per-instance __dict__ for the slotted subclasses
+    __slots__ = ()
+
     @classmethod
-    def from_json[T](cls: type[T], json_string: str | bytes | bytearray) -> T:
-        return structure(json.loads(json_string), cls)
+    def from_json[T](
+        cls: type[T], json_string: str | bytes | bytearray | memoryview
+    ) -> T:
+        return _converter.structure(orjson.loads(json_string), cls)
 
     def to_json(self) -> str:
-        return json.dumps(unstructure(self))
+        return self.to_json_bytes().decode()
+
+    def to_json_bytes(self) -> bytes:
+        return orjson.dumps(_converter.unstructure(self))
 
 
 class ConfigObject(ABC, JSONSeriablizable):
+    __slots__ = ()
+
     @abstractmethod
     def get_description(self) -> str:
         raise NotImplementedError("get_description must be overwritten!")
@@ -27,19 +43,20 @@ class ConfigObject(ABC, JSONSeriablizable):
         raise NotImplementedError("get_uid must be overwritten!")
 
 
-@attrs.frozen(slots=True)
+@attrs.frozen(slots=True, cache_hash=True, weakref_slot=False)
 class EmmissionPair(JSONSeriablizable):
     wavelength: int
     intensity: float
 
 
-@attrs.frozen(slots=True)
+@attrs.frozen(slots=True, cache_hash=True, weakref_slot=False)
 class EventPair(JSONSeriablizable):
     timepoint: float
-    event: str
+    # Event texts repeat a lot, share one string object per distinct text
+    event: str = attrs.field(converter=sys.intern)
 
 
-@attrs.frozen(slots=True)
+@attrs.frozen(slots=True, cache_hash=True, weakref_slot=False)
 class MeasuredDataAtTimePoint(JSONSeriablizable):
     timepoint: float
     temperature_thermocouple: float
@@ -58,7 +75,7 @@ class MeasuredDataAtTimePoint(JSONSeriablizable):
     ambient_light: float
 
 
-@attrs.frozen(slots=True)
+@attrs.frozen(slots=True, cache_hash=True, weakref_slot=False)
 class LED(ConfigObject):
     uid: int
     name: str
@@ -89,7 +106,7 @@ class LED(ConfigObject):
         return self.min_wavelength <= 400
 
 
-@attrs.frozen(slots=True)
+@attrs.frozen(slots=True, cache_hash=True, weakref_slot=False)
 class TinkerforgeBricklet(ConfigObject):
     uid: int  # TODO: we have a problem here. TinkerForge uids may be literal.
     name: str
@@ -104,7 +121,7 @@ class TinkerforgeBricklet(ConfigObject):
         return self.uid
 
 
-@attrs.frozen(slots=True)
+@attrs.frozen(slots=True, cache_hash=True, weakref_slot=False)
 class HardwareConfig(ConfigObject):
     uid: int
     name: str
@@ -126,7 +143,7 @@ class HardwareConfig(ConfigObject):
         return self.uid
 
 
-@attrs.frozen(slots=True)
+@attrs.frozen(slots=True, cache_hash=True, weakref_slot=False)
 class ExperimentTemplate(ConfigObject):
     uid: int
     name: str
@@ -153,7 +170,7 @@ class ExperimentTemplate(ConfigObject):
         return self.uid
 
 
-@attrs.frozen(slots=True)
+@attrs.frozen(slots=True, cache_hash=True, weakref_slot=False)
 class Experiment(ConfigObject):
     uid: int
     name: str
@@ -184,3 +201,23 @@ class Experiment(ConfigObject):
 
     def get_uid(self) -> int:
         return self.uid
+
+
+# Leaves first, so the hooks of the nested classes are already registered
+# when the outer ones are generated.
+for _cls in (
+    EmmissionPair,
+    EventPair,
+    MeasuredDataAtTimePoint,
+    LED,
+    TinkerforgeBricklet,
+    HardwareConfig,
+    ExperimentTemplate,
+    Experiment,
+):
+    _converter.register_structure_hook(
+        _cls, make_dict_structure_fn(_cls, _converter)
+    )
+    _converter.register_unstructure_hook(
+        _cls, make_dict_unstructure_fn(_cls, _converter)
+    )
@@ -1,14 +1,16 @@
 # mypy: disable-error-code=import-untyped
 # We dont have typing information for tinkerforge unfurtunately :(
 
+import contextlib
 import logging
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
-from functools import partial
 from typing import Any, Self
 
 import attrs
-from attrs import define, field, frozen, setters
+from attrs import define, frozen
+from tinkerforge.ip_connection import Error as TfIpError
 from tinkerforge.ip_connection import IPConnection
 
 from prcontrol.controller.common import LedLane, LedPosition, LedSide, LedState
@@ -38,7 +40,8 @@ class ThresholdStatus(Enum):
     ABORT = 3
 
 
-@define
+# Mutated from the sensor callbacks, never compared
+@define(eq=False, weakref_slot=False)
 class ControllerState:
     reactor_box_connected: bool
     power_box_connected: bool
@@ -59,8 +62,8 @@ class ControllerState:
     IR_temp_3_threshold_status: ThresholdStatus
     thermocouple_theshold_status: ThresholdStatus
 
-    reactor_box_state: ReactorBoxSensorState = field(on_setattr=setters.NO_OP)
-    power_box_state: PowerBoxSensorState = field(on_setattr=setters.NO_OP)
+    reactor_box_state: ReactorBoxSensorState
+    power_box_state: PowerBoxSensorState
 
     @staticmethod
     def default(
@@ -86,6 +89,60 @@ class ControllerState:
         )
 
 
+# Per-lane fields of `ControllerState` and the reactorbox io panel,
+# indexed by `LedLane.value`.
+_IR_TEMP_STATUS_FIELDS = (
+    "IR_temp_1_threshold_status",
+    "IR_temp_2_threshold_status",
+    "IR_temp_3_threshold_status",
+)
+_SAMPLE_FIELDS = ("sample_lane_1", "sample_lane_2", "sample_lane_3")
+_IR_TEMP_LED_FIELDS = (
+    "led_warning_temp_lane_1",
+    "led_warning_temp_lane_2",
+    "led_warning_temp_lane_3",
+)
+_SAMPLE_LED_FIELDS = (
+    "led_state_lane_1",
+    "led_state_lane_2",
+    "led_state_lane_3",
+)
+
+
+# Lane temperature LED for each `ThresholdStatus`
+_IR_TEMP_STATUS_LEDS = {
+    ThresholdStatus.OK: LedState.HIGH,
+    ThresholdStatus.EXCEEDED: LedState.BLINK_FAST,
+    ThresholdStatus.OK_AGAIN: LedState.BLINK_SLOW,
+    ThresholdStatus.ABORT: LedState.LOW,
+}
+
+_AMBIENT_TEMP_STATUS_LEDS = {
+    ThresholdStatus.OK: LedState.HIGH,
+    ThresholdStatus.EXCEEDED: LedState.LOW,
+    ThresholdStatus.OK_AGAIN: LedState.BLINK_SLOW,
+    ThresholdStatus.ABORT: LedState.LOW,
+}
+
+_THERMOCOUPLE_STATUS_LEDS = _AMBIENT_TEMP_STATUS_LEDS
+
+# Warning LED for no, one and several voltage errors
+_VOLTAGE_ERROR_LEDS = (LedState.LOW, LedState.BLINK_SLOW, LedState.BLINK_FAST)
+
+
+def _log_persist_failure(future: "Future[None]") -> None:
+    exc = future.exception()
+    if exc is not None:
+        logger.error(f"Could not store experiment: {exc!r}")
+
+
+def _led_bit(led: LedPosition) -> int:
+    return 1 << (2 * led.lane.value + led.side.value)
+
+
+_ALL_LANES = frozenset((LedLane.LANE_1, LedLane.LANE_2, LedLane.LANE_3))
+
+
 @frozen
 class TfEndpoint:
     host: str
@@ -105,26 +162,70 @@ class ControllerConfig:
 
     threshold_uv: UvIndex
 
+    # Raw forms of the thresholds above, the observers compare plain ints
+    _warn_IR_hundredths: tuple[int, ...] = attrs.field(
+        init=False, eq=False, repr=False
+    )
+    _abort_IR_hundredths: tuple[int, ...] = attrs.field(
+        init=False, eq=False, repr=False
+    )
+    _warn_ambient_hundredths: int = attrs.field(
+        init=False, eq=False, repr=False
+    )
+    _abort_ambient_hundredths: int = attrs.field(
+        init=False, eq=False, repr=False
+    )
+    _thermocouple_hundredths: int = attrs.field(
+        init=False, eq=False, repr=False
+    )
+    _uv_tenths: int = attrs.field(init=False, eq=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        # The class is frozen, so bypass its __setattr__ once here
+        set_raw = object.__setattr__
+        set_raw(
+            self,
+            "_warn_IR_hundredths",
+            tuple(t.hundredth_celsius for t in self.threshold_warn_IR_temp),
+        )
+        set_raw(
+            self,
+            "_abort_IR_hundredths",
+            tuple(t.hundredth_celsius for t in self.threshold_abort_IR_temp),
+        )
+        set_raw(
+            self,
+            "_warn_ambient_hundredths",
+            self.threshold_warn_ambient_temp.hundredth_celsius,
+        )
+        set_raw(
+            self,
+            "_abort_ambient_hundredths",
+            self.threshold_abort_ambient_temp.hundredth_celsius,
+        )
+        set_raw(
+            self,
+            "_thermocouple_hundredths",
+            self.threshold_thermocouple_temp.hundredth_celsius,
+        )
+        set_raw(self, "_uv_tenths", self.threshold_uv.tenth_uvi)
+
     @staticmethod
     def default_values() -> "ControllerConfig":
         # TODO get sensible values
+        warn_ir_temp = Temperature.from_celsius(30)
+        abort_ir_temp = Temperature.from_celsius(35)
         return ControllerConfig(
             threshold_warn_ambient_temp=Temperature.from_celsius(35),
             threshold_abort_ambient_temp=Temperature.from_celsius(30),
-            threshold_warn_IR_temp=(
-                Temperature.from_celsius(30),
-                Temperature.from_celsius(30),
-                Temperature.from_celsius(30),
-            ),
+            threshold_warn_IR_temp=(warn_ir_temp, warn_ir_temp, warn_ir_temp),
             threshold_abort_IR_temp=(
-                Temperature.from_celsius(35),
-                Temperature.from_celsius(35),
-                Temperature.from_celsius(35),
+                abort_ir_temp,
+                abort_ir_temp,
+                abort_ir_temp,
             ),
             threshold_thermocouple_temp=Temperature.from_celsius(30),
-            threshold_thermocouple_affected_lanes=frozenset(
-                (LedLane.LANE_1, LedLane.LANE_2, LedLane.LANE_3)
-            ),
+            threshold_thermocouple_affected_lanes=_ALL_LANES,
             threshold_uv=UvIndex.from_tenth_uvi(1),
         )
 
@@ -135,6 +236,24 @@ type SensorObserver[T] = Callable[
 ]
 
 
+def _bind_observer[T, A](
+    observer: Callable[[T, T, "attrs.Attribute[Any]", Any, A], None],
+    arg: A,
+) -> SensorObserver[T]:
+    """Binds the trailing `lane`/`led` argument of an observer.
+
+    A closure passing it positionally is considerably cheaper to call than
+    a `partial` with keyword arguments, which builds a new dict every call.
+    """
+
+    def bound(
+        old: T, new: T, attribute: "attrs.Attribute[Any]", value: Any
+    ) -> None:
+        observer(old, new, attribute, value, arg)
+
+    return bound
+
+
 class Controller:
     # TODO:
     #  - depending the config, set UV installed (software)
@@ -157,6 +276,8 @@ class Controller:
 
     experiment_supervisor: ExperimentSupervisor
     _config_manager: ConfigManager
+    # Writes finished experiments to disk, off the sensor callback threads
+    _persist_pool: ThreadPoolExecutor
 
     # These are used to specify the callback handlers for changes in
     # both ReactorBoxSensorState and PowerBoxSensorState.
@@ -173,8 +294,14 @@ class Controller:
         "attrs.Attribute[Any]",
         SensorObserver[PowerBoxSensorState],
     ]
+    # The same handlers keyed by attribute name for dispatching.
+    # attrs.Attribute hashes all of its fields on every lookup,
+    # the (cached) hash of the name is much cheaper.
+    _dispatch_reactor_box: dict[str, SensorObserver[ReactorBoxSensorState]]
+    _dispatch_power_box: dict[str, SensorObserver[PowerBoxSensorState]]
 
-    _voltage_errors: set[LedPosition]
+    # One bit per LED, see `_led_bit`
+    _voltage_errors: int
 
     def __init__(
         self,
@@ -188,6 +315,9 @@ class Controller:
         logger.info("Initializing Controller")
 
         self._config_manager = config_manager
+        self._persist_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="persist-experiment"
+        )
         if not isinstance(reactor_box, TfEndpoint):
             reactor_box = TfEndpoint(*reactor_box)
         if not isinstance(power_box, TfEndpoint):
@@ -197,7 +327,7 @@ class Controller:
             config = ControllerConfig.default_values()
         self.config = config
 
-        self._voltage_errors = set()
+        self._voltage_errors = 0
 
         self._reactor_box_ipcon = IPConnection()
         self._reactor_box_endpoint = reactor_box
@@ -248,24 +378,24 @@ class Controller:
             reactor_sensors.thermocouble_temp: self._observer_thermocouple,
             reactor_sensors.ambient_light: noop,
             reactor_sensors.ambient_temperature: self._observer_ambient_temp,
-            reactor_sensors.lane_1_ir_temp: partial(
-                self._observer_ir_temp_lane, lane=LedLane.LANE_1
+            reactor_sensors.lane_1_ir_temp: _bind_observer(
+                self._observer_ir_temp_lane, LedLane.LANE_1
             ),
-            reactor_sensors.lane_2_ir_temp: partial(
-                self._observer_ir_temp_lane, lane=LedLane.LANE_2
+            reactor_sensors.lane_2_ir_temp: _bind_observer(
+                self._observer_ir_temp_lane, LedLane.LANE_2
             ),
-            reactor_sensors.lane_3_ir_temp: partial(
-                self._observer_ir_temp_lane, lane=LedLane.LANE_3
+            reactor_sensors.lane_3_ir_temp: _bind_observer(
+                self._observer_ir_temp_lane, LedLane.LANE_3
             ),
             reactor_sensors.uv_index: self._observer_uv_sensor,
-            reactor_sensors.lane_1_sample_taken: partial(
-                self._observer_sample_taken, lane=LedLane.LANE_1
+            reactor_sensors.lane_1_sample_taken: _bind_observer(
+                self._observer_sample_taken, LedLane.LANE_1
             ),
-            reactor_sensors.lane_2_sample_taken: partial(
-                self._observer_sample_taken, lane=LedLane.LANE_2
+            reactor_sensors.lane_2_sample_taken: _bind_observer(
+                self._observer_sample_taken, LedLane.LANE_2
             ),
-            reactor_sensors.lane_3_sample_taken: partial(
-                self._observer_sample_taken, lane=LedLane.LANE_3
+            reactor_sensors.lane_3_sample_taken: _bind_observer(
+                self._observer_sample_taken, LedLane.LANE_3
             ),
             reactor_sensors.maintenance_mode: self._observer_maintenance,
             reactor_sensors.cable_control: self._observer_reactor_box_cable,
@@ -282,29 +412,29 @@ class Controller:
             power_sensors.abmient_temperature: noop,
             power_sensors.voltage_total: noop,
             power_sensors.current_total: noop,
-            power_sensors.voltage_lane_1_front: partial(
+            power_sensors.voltage_lane_1_front: _bind_observer(
                 self._observer_voltage_error,
-                led=LedPosition(LedLane.LANE_1, LedSide.FRONT),
+                LedPosition.of(LedLane.LANE_1, LedSide.FRONT),
             ),
-            power_sensors.voltage_lane_1_back: partial(
+            power_sensors.voltage_lane_1_back: _bind_observer(
                 self._observer_voltage_error,
-                led=LedPosition(LedLane.LANE_1, LedSide.BACK),
+                LedPosition.of(LedLane.LANE_1, LedSide.BACK),
             ),
-            power_sensors.voltage_lane_2_front: partial(
+            power_sensors.voltage_lane_2_front: _bind_observer(
                 self._observer_voltage_error,
-                led=LedPosition(LedLane.LANE_2, LedSide.FRONT),
+                LedPosition.of(LedLane.LANE_2, LedSide.FRONT),
             ),
-            power_sensors.voltage_lane_2_back: partial(
+            power_sensors.voltage_lane_2_back: _bind_observer(
                 self._observer_voltage_error,
-                led=LedPosition(LedLane.LANE_2, LedSide.BACK),
+                LedPosition.of(LedLane.LANE_2, LedSide.BACK),
             ),
-            power_sensors.voltage_lane_3_front: partial(
+            power_sensors.voltage_lane_3_front: _bind_observer(
                 self._observer_voltage_error,
-                led=LedPosition(LedLane.LANE_3, LedSide.FRONT),
+                LedPosition.of(LedLane.LANE_3, LedSide.FRONT),
             ),
-            power_sensors.voltage_lane_3_back: partial(
+            power_sensors.voltage_lane_3_back: _bind_observer(
                 self._observer_voltage_error,
-                led=LedPosition(LedLane.LANE_3, LedSide.BACK),
+                LedPosition.of(LedLane.LANE_3, LedSide.BACK),
             ),
             power_sensors.current_lane_1_front: noop,
             power_sensors.current_lane_1_back: noop,
@@ -330,6 +460,19 @@ class Controller:
             "callback handler in Controller! Pls fix!"
         # fmt: on
 
+        self._dispatch_reactor_box = {
+            attribute.name: handler
+            for attribute, handler in (
+                self._callback_handlers_reactor_box.items()
+            )
+        }
+        self._dispatch_power_box = {
+            attribute.name: handler
+            for attribute, handler in (
+                self._callback_handlers_power_box.items()
+            )
+        }
+
         self.experiment_supervisor = ExperimentSupervisor(self)
         logger.debug("Initializing Controller done.")
 
@@ -348,21 +491,8 @@ class Controller:
         return self
 
     def initialize(self) -> Self:
-        for f in self._callback_handlers_power_box:
-            self._dispatch_onchange_power_box(
-                self.power_box.sensors,
-                self.power_box.sensors,
-                f,
-                getattr(self.power_box.sensors, f.name),
-            )
-
-        for f in self._callback_handlers_reactor_box:
-            self._dispatch_onchange_reactor_box(
-                self.reactor_box.sensors,
-                self.reactor_box.sensors,
-                f,
-                getattr(self.reactor_box.sensors, f.name),
-            )
+        self._redispatch_power_box()
+        self._redispatch_reactor_box()
 
         self.reactor_box.io_panel.led_state_lane_1 = LedState.LOW
         self.reactor_box.io_panel.led_state_lane_2 = LedState.LOW
@@ -376,19 +506,21 @@ class Controller:
         self._power_box_ipcon.disconnect()
         return self
 
+    def shutdown(self) -> None:
+        """Turns off all LEDs on the powerbox, if it is still reachable."""
+        logger.info("Shutting down")
+        # Let pending experiments reach the disk
+        self._persist_pool.shutdown(wait=True)
+        with contextlib.suppress(TfIpError):
+            self.power_box.reset_leds()
+
     def _add_event_on_all_lanes(self, event_str: str) -> None:
-        self.experiment_supervisor.add_event_on(LedLane.LANE_1, event_str)
-        self.experiment_supervisor.add_event_on(LedLane.LANE_2, event_str)
-        self.experiment_supervisor.add_event_on(LedLane.LANE_3, event_str)
+        self.experiment_supervisor.add_event_on_all(event_str)
 
     def _cancel_all_experiments(self, msg: str | None = None) -> None:
         logger.warning(f"Canceling all experiments! Reason: {msg}")
-        self.experiment_supervisor.register_error_on(LedLane.LANE_1)
-        self.experiment_supervisor.register_error_on(LedLane.LANE_2)
-        self.experiment_supervisor.register_error_on(LedLane.LANE_3)
-        self.experiment_supervisor.cancel_experiment_on(LedLane.LANE_1)
-        self.experiment_supervisor.cancel_experiment_on(LedLane.LANE_2)
-        self.experiment_supervisor.cancel_experiment_on(LedLane.LANE_3)
+        self.experiment_supervisor.register_error_on_all()
+        self.experiment_supervisor.cancel_all()
 
     def _dispatch_onchange_reactor_box(
         self,
@@ -397,11 +529,13 @@ class Controller:
         attribute: "attrs.Attribute[Any]",
         value: Any,
     ) -> None:
-        if attribute not in self._callback_handlers_reactor_box:
-            raise RuntimeError(f"Unhandled callback attribute {attribute}.")
-        self._callback_handlers_reactor_box[attribute](
-            old_sensors, new_sensors, attribute, value
-        )
+        try:
+            handler = self._dispatch_reactor_box[attribute.name]
+        except KeyError:
+            raise RuntimeError(
+                f"Unhandled callback attribute {attribute}."
+            ) from None
+        handler(old_sensors, new_sensors, attribute, value)
 
     def _dispatch_onchange_power_box(
         self,
@@ -410,16 +544,37 @@ class Controller:
         attribute: "attrs.Attribute[Any]",
         value: Any,
     ) -> None:
-        if attribute not in self._callback_handlers_power_box:
-            raise RuntimeError(f"Unhandled callback attribute {attribute}.")
-        self._callback_handlers_power_box[attribute](
-            old_sensors, new_sensors, attribute, value
-        )
+        try:
+            handler = self._dispatch_power_box[attribute.name]
+        except KeyError:
+            raise RuntimeError(
+                f"Unhandled callback attribute {attribute}."
+            ) from None
+        handler(old_sensors, new_sensors, attribute, value)
+
+    def _redispatch_power_box(self) -> None:
+        """Runs the observers for the current power box readings."""
+        sensors = self.power_box.sensors
+        for f in self._callback_handlers_power_box:
+            self._dispatch_onchange_power_box(
+                sensors, sensors, f, getattr(sensors, f.name)
+            )
+
+    def _redispatch_reactor_box(self) -> None:
+        """Runs the observers for the current reactor box readings."""
+        sensors = self.reactor_box.sensors
+        for f in self._callback_handlers_reactor_box:
+            self._dispatch_onchange_reactor_box(
+                sensors, sensors, f, getattr(sensors, f.name)
+            )
 
     def _callback_reactor_box_connected(self, *_: Any) -> None:
         self.state.reactor_box_connected = True
         logger.debug("Connection callback received from reactor box")
         self.reactor_box.initialize()
+        # initialize() resets the status LEDs, and unchanged readings are
+        # not reported again. Restore the LEDs of still active faults.
+        self._redispatch_reactor_box()
         self._set_connected_led()
 
     def _callback_reactor_box_disconnected(self, *_: Any) -> None:
@@ -433,6 +588,8 @@ class Controller:
         #   see above....
         logger.debug("Connection callback received from power box")
         self.power_box.initialize()
+        # See _callback_reactor_box_connected
+        self._redispatch_power_box()
         self._set_connected_led()
 
     def _callback_power_box_disconnected(self, *_: Any) -> None:
@@ -470,15 +627,12 @@ class Controller:
         wurden zwei Spannungsfehler für eine Lane detektiert, soll die
         LED schnell blinken (250 ms an / 250 ms aus).
         """
-        if lane == LedLane.LANE_1:
-            self.state.sample_lane_1 = True
-            self.reactor_box.io_panel.led_state_lane_1 = LedState.HIGH
-        elif lane == LedLane.LANE_2:
-            self.state.sample_lane_2 = True
-            self.reactor_box.io_panel.led_state_lane_2 = LedState.HIGH
-        elif lane == LedLane.LANE_3:
-            self.state.sample_lane_3 = True
-            self.reactor_box.io_panel.led_state_lane_3 = LedState.HIGH
+        setattr(self.state, _SAMPLE_FIELDS[lane.value], True)
+        setattr(
+            self.reactor_box.io_panel,
+            _SAMPLE_LED_FIELDS[lane.value],
+            LedState.HIGH,
+        )
 
         return self
 
@@ -486,11 +640,35 @@ class Controller:
         self.reactor_box.io_panel.led_experiment_running = LedState.HIGH
 
     def end_experiment(self, lane: LedLane, data: Experiment) -> None:
-        self._config_manager.experiments.add(data)
+        # Serializing and writing a long measurement log takes a while,
+        # don't hold up the sensor callbacks for it.
+        future = self._persist_pool.submit(
+            self._config_manager.experiments.add, data
+        )
+        future.add_done_callback(_log_persist_failure)
         if not self.experiment_supervisor.is_running():
             self.reactor_box.io_panel.led_experiment_running = LedState.LOW
         return
 
+    def start_blocked_by(self, lane: LedLane) -> str | None:
+        """Why no experiment may start on `lane` right now, if at all.
+
+        An active abort only stops experiments on the next reading, so
+        new ones are checked before they start.
+        """
+        state = self.state
+        if state.ambient_temp_status is ThresholdStatus.ABORT:
+            return "Ambient temperature exceeded critical threshold"
+        ir_status = getattr(state, _IR_TEMP_STATUS_FIELDS[lane.value])
+        if ir_status is ThresholdStatus.ABORT:
+            return "IR Temperature exceeded critical threshold"
+        if (
+            state.thermocouple_theshold_status is ThresholdStatus.EXCEEDED
+            and lane in self.config.threshold_thermocouple_affected_lanes
+        ):
+            return "Thermocouple exceeded critical threshold"
+        return None
+
     def reset_ambient_temp_warning(self) -> Self:
         self.state.ambient_temp_status = ThresholdStatus.OK
         return self
@@ -520,10 +698,10 @@ class Controller:
         Öffnungszustand StromBox; A1 StromBox erkennt Öffnungszustand
         PhotoBox), soll diese LED leuchten.
         """
+        # Enum members are singletons, identity is enough
         if (
-            new_state.powerbox_lid
-            == new_state.reactorbox_lid
-            == CaseLidState.CLOSED
+            new_state.powerbox_lid is CaseLidState.CLOSED
+            and new_state.reactorbox_lid is CaseLidState.CLOSED
         ):
             self.power_box.io_panel.led_boxes_closed = LedState.HIGH
             self.experiment_supervisor.auto_resume_on_closed_box()
@@ -595,20 +773,17 @@ class Controller:
             and self.power_box.is_led_active(led)
             and False
         ):
-            self._voltage_errors.add(led)
+            self._voltage_errors |= _led_bit(led)
             self.experiment_supervisor.add_event_on(led.lane, "Voltage Error")
             self.experiment_supervisor.register_error_on(led.lane)
             self.experiment_supervisor.cancel_experiment_on(led.lane)
-        elif led in self._voltage_errors:
-            self._voltage_errors.remove(led)
-
-        num_errors = len(self._voltage_errors)
-        if num_errors == 1:
-            self.power_box.io_panel.led_warning_voltage = LedState.BLINK_SLOW
-        elif num_errors:
-            self.power_box.io_panel.led_warning_voltage = LedState.BLINK_FAST
         else:
-            self.power_box.io_panel.led_warning_voltage = LedState.LOW
+            self._voltage_errors &= ~_led_bit(led)
+
+        num_errors = self._voltage_errors.bit_count()
+        self.power_box.io_panel.led_warning_voltage = _VOLTAGE_ERROR_LEDS[
+            min(num_errors, 2)
+        ]
 
     def _observer_ir_temp_lane(
         self,
@@ -632,16 +807,19 @@ class Controller:
         Running dann auch ausgeschaltet werden (wenn dies da einzige oder
         letzte Experiment war).
         """
-        threshold_abort = lane.demux(*self.config.threshold_abort_IR_temp)
-        threshold_warn = lane.demux(*self.config.threshold_warn_IR_temp)
+        i = lane.value
+        config = self.config
+        state = self.state
+        threshold_abort = config.threshold_abort_IR_temp[i]
+        threshold_warn = config.threshold_warn_IR_temp[i]
 
-        old_status = lane.demux(
-            self.state.IR_temp_1_threshold_status,
-            self.state.IR_temp_2_threshold_status,
-            self.state.IR_temp_3_threshold_status,
-        )
+        old_status = getattr(state, _IR_TEMP_STATUS_FIELDS[i])
+        raw_temp = temp.hundredth_celsius
 
-        if temp > threshold_abort or old_status == ThresholdStatus.ABORT:
+        if (
+            raw_temp > config._abort_IR_hundredths[i]
+            or old_status is ThresholdStatus.ABORT
+        ):
             warning = (
                 f"IR temp threshold reached for lane {lane}!: "
                 f"Threshold: {threshold_abort}, "
@@ -655,17 +833,19 @@ class Controller:
             logger.warning(warning)
             new_status = ThresholdStatus.ABORT
 
-        elif temp > threshold_warn:
-            logger.warning(
-                f"IR temp in lane {lane} exceeded threshold. "
-                f"Threshold: {threshold_warn}, temp: {temp}"
-            )
-            self.experiment_supervisor.add_event_on(
-                lane, "IR Temperature exceeded first threshold"
-            )
+        elif raw_temp > config._warn_IR_hundredths[i]:
+            # Report the crossing once, not on every reading above it
+            if old_status is not ThresholdStatus.EXCEEDED:
+                logger.warning(
+                    f"IR temp in lane {lane} exceeded threshold. "
+                    f"Threshold: {threshold_warn}, temp: {temp}"
+                )
+                self.experiment_supervisor.add_event_on(
+                    lane, "IR Temperature exceeded first threshold"
+                )
             new_status = ThresholdStatus.EXCEEDED
 
-        elif old_status == ThresholdStatus.EXCEEDED:
+        elif old_status is ThresholdStatus.EXCEEDED:
             self.experiment_supervisor.add_event_on(
                 lane, "IR Temperature back to normal"
             )
@@ -674,24 +854,9 @@ class Controller:
         else:
             new_status = old_status
 
-        if new_status == ThresholdStatus.ABORT:
-            new_led = LedState.LOW
-        elif new_status == ThresholdStatus.EXCEEDED:
-            new_led = LedState.BLINK_FAST
-        elif new_status == ThresholdStatus.OK_AGAIN:
-            new_led = LedState.BLINK_SLOW
-        else:
-            new_led = LedState.HIGH
-
-        if lane == LedLane.LANE_1:
-            self.state.IR_temp_1_threshold_status = new_status
-            self.reactor_box.io_panel.led_warning_temp_lane_1 = new_led
-        elif lane == LedLane.LANE_2:
-            self.state.IR_temp_2_threshold_status = new_status
-            self.reactor_box.io_panel.led_warning_temp_lane_2 = new_led
-        elif lane == LedLane.LANE_3:
-            self.state.IR_temp_3_threshold_status = new_status
-            self.reactor_box.io_panel.led_warning_temp_lane_3 = new_led
+        new_led = _IR_TEMP_STATUS_LEDS[new_status]
+        setattr(state, _IR_TEMP_STATUS_FIELDS[i], new_status)
+        setattr(self.reactor_box.io_panel, _IR_TEMP_LED_FIELDS[i], new_led)
 
     def _observer_reactor_box_cable(
         self,
@@ -726,15 +891,12 @@ class Controller:
             return
 
         self.experiment_supervisor.sample_was_taken_on(lane)
-        if lane == LedLane.LANE_1:
-            self.state.sample_lane_1 = False
-            self.reactor_box.io_panel.led_state_lane_1 = LedState.LOW
-        elif lane == LedLane.LANE_2:
-            self.state.sample_lane_2 = False
-            self.reactor_box.io_panel.led_state_lane_2 = LedState.LOW
-        elif lane == LedLane.LANE_3:
-            self.state.sample_lane_3 = False
-            self.reactor_box.io_panel.led_state_lane_3 = LedState.LOW
+        setattr(self.state, _SAMPLE_FIELDS[lane.value], False)
+        setattr(
+            self.reactor_box.io_panel,
+            _SAMPLE_LED_FIELDS[lane.value],
+            LedState.LOW,
+        )
 
     def _observer_uv_sensor(
         self,
@@ -750,12 +912,13 @@ class Controller:
         (A7 PhotoBox → low), sollte der Wert danach wieder unter den
         hinterlegten Wert fallen soll wieder auf grün geschaltet werden.
         """
-        if uv_index > self.config.threshold_uv:
-            self.reactor_box.io_panel.led_uv_warning = LedState.LOW
+        panel = self.reactor_box.io_panel
+        if uv_index.tenth_uvi > self.config._uv_tenths:
+            panel.led_uv_warning = LedState.LOW
         else:
-            self.reactor_box.io_panel.led_uv_warning = LedState.HIGH
+            panel.led_uv_warning = LedState.HIGH
 
-        self.reactor_box.io_panel.led_uv_installed = (
+        panel.led_uv_installed = (
             LedState.HIGH if self.state.uv_installed else LedState.LOW
         )
 
@@ -775,13 +938,16 @@ class Controller:
         Temperatur danach wieder unter die hinterlegte Temperatur fallen
         soll alle 500 ms zwischen rot und grün gewechselt werden
         """
+        config = self.config
+        state = self.state
+        raw_temp = temp.hundredth_celsius
         if (
-            temp > self.config.threshold_abort_ambient_temp
-            or self.state.ambient_temp_status == ThresholdStatus.ABORT
+            raw_temp > config._abort_ambient_hundredths
+            or state.ambient_temp_status is ThresholdStatus.ABORT
         ):
             warning = (
                 f"Ambient threshold reached!: "
-                f"Threshold: {self.config.threshold_abort_ambient_temp}, "
+                f"Threshold: {config.threshold_abort_ambient_temp}, "
                 f"Temperature: {temp}"
             )
             self._add_event_on_all_lanes(
@@ -789,29 +955,24 @@ class Controller:
             )
             self._cancel_all_experiments()
             logger.warning(warning)
-            self.state.ambient_temp_status = ThresholdStatus.ABORT
-        elif temp > self.config.threshold_warn_ambient_temp:
-            self.state.ambient_temp_status = ThresholdStatus.EXCEEDED
-            self._add_event_on_all_lanes(
-                "Ambient Temperature exceeded first threshold"
-            )
-            logger.warning("High temperature ({temp})")
-        elif self.state.ambient_temp_status == ThresholdStatus.EXCEEDED:
-            self.state.ambient_temp_status = ThresholdStatus.OK_AGAIN
+            state.ambient_temp_status = ThresholdStatus.ABORT
+        elif raw_temp > config._warn_ambient_hundredths:
+            # Report the crossing once, not on every reading above it
+            if state.ambient_temp_status is not ThresholdStatus.EXCEEDED:
+                state.ambient_temp_status = ThresholdStatus.EXCEEDED
+                self._add_event_on_all_lanes(
+                    "Ambient Temperature exceeded first threshold"
+                )
+                logger.warning(f"High temperature ({temp})")
+        elif state.ambient_temp_status is ThresholdStatus.EXCEEDED:
+            state.ambient_temp_status = ThresholdStatus.OK_AGAIN
             self._add_event_on_all_lanes("Ambient Temperature back to normal")
         # Otherwise we hold the state...
 
         # And set the LED accordingly
-        status = self.state.ambient_temp_status
-        if status == ThresholdStatus.OK:
-            led = LedState.HIGH
-        elif status in (ThresholdStatus.EXCEEDED, ThresholdStatus.ABORT):
-            led = LedState.LOW
-        elif status == ThresholdStatus.OK_AGAIN:
-            led = LedState.BLINK_SLOW
-        else:
-            raise RuntimeError(f"Unhandled status {status}")
-        self.power_box.io_panel.led_warning_temp_ambient = led
+        self.power_box.io_panel.led_warning_temp_ambient = (
+            _AMBIENT_TEMP_STATUS_LEDS[state.ambient_temp_status]
+        )
 
     def _observer_thermocouple(
         self,
@@ -833,22 +994,16 @@ class Controller:
         werden soll, sollte der Temperatur-Wert überschritten werden.
         """
         st = self.state
-        if temp > self.config.threshold_thermocouple_temp:
+        config = self.config
+        if temp.hundredth_celsius > config._thermocouple_hundredths:
             st.thermocouple_theshold_status = ThresholdStatus.EXCEEDED
-            for lane in self.config.threshold_thermocouple_affected_lanes:
-                self.experiment_supervisor.add_event_on(
-                    lane, "Thermocouple exceeded critical threshold"
-                )
-                self.experiment_supervisor.register_error_on(lane)
-                self.experiment_supervisor.cancel_experiment_on(lane)
-        elif st.thermocouple_theshold_status == ThresholdStatus.EXCEEDED:
+            self.experiment_supervisor.abort_experiments_on(
+                config.threshold_thermocouple_affected_lanes,
+                "Thermocouple exceeded critical threshold",
+            )
+        elif st.thermocouple_theshold_status is ThresholdStatus.EXCEEDED:
             st.thermocouple_theshold_status = ThresholdStatus.OK_AGAIN
 
-        if st.thermocouple_theshold_status == ThresholdStatus.OK:
-            self.reactor_box.io_panel.led_warning_thermocouple = LedState.HIGH
-        elif st.thermocouple_theshold_status == ThresholdStatus.OK_AGAIN:
-            self.reactor_box.io_panel.led_warning_thermocouple = (
-                LedState.BLINK_SLOW
-            )
-        else:
-            self.reactor_box.io_panel.led_warning_thermocouple = LedState.HIGH
+        self.reactor_box.io_panel.led_warning_thermocouple = (
+            _THERMOCOUPLE_STATUS_LEDS[st.thermocouple_theshold_status]
+        )
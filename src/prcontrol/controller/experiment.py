@@ -1,11 +1,17 @@
+import heapq
+import itertools
 import logging
 import sched
 import time
-from collections.abc import Callable
+from array import array
+from collections.abc import Callable, Iterable
 from datetime import datetime, timedelta
-from threading import Thread
+from operator import attrgetter
+from threading import Condition, Thread
 from typing import TYPE_CHECKING
 
+import attrs
+
 from prcontrol.controller.common import LedLane, LedPosition, LedSide
 from prcontrol.controller.configuration import (
     EventPair,
@@ -21,46 +27,101 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class _TimerQueue:
+    """Runs the callbacks of all `Timer`s from one shared thread.
+
+    Entries are not removed on pause, they are skipped when their timer's
+    generation has moved on in the meantime.
+    """
+
+    _heap: list[tuple[float, int, int, "Timer"]]
+    _condition: Condition
+    _thread: Thread | None
+
+    def __init__(self) -> None:
+        self._heap = []
+        self._order = itertools.count()
+        self._condition = Condition()
+        self._thread = None
+
+    def schedule(self, timer: "Timer", deadline: float) -> None:
+        with self._condition:
+            heapq.heappush(
+                self._heap,
+                (deadline, next(self._order), timer._generation, timer),
+            )
+            if self._thread is None:
+                self._thread = Thread(
+                    target=self._run, name="experiment-timers", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    timeout = None
+                    if self._heap:
+                        timeout = self._heap[0][0] - time.monotonic()
+                        if timeout <= 0:
+                            break
+                    self._condition.wait(timeout)
+                _, _, generation, timer = heapq.heappop(self._heap)
+            # Outside the lock, the callback may schedule timers itself.
+            # A failing callback must not stop the timers of other lanes.
+            try:
+                timer._fire(generation)
+            except Exception:
+                logger.exception("Experiment timer callback failed")
+
+
+_timer_queue = _TimerQueue()
+
+
 class Timer:
     callback: Callable[[], None]
-    thread: Thread
-    datetime_end: datetime
-    time_remaining: timedelta
+    deadline: float
+    time_remaining: float
     paused: bool
     running: bool
+    # Bumped whenever a queued deadline becomes stale
+    _generation: int
 
     def __init__(
         self,
         callback: Callable[[], None],
     ):
         self.callback = callback
-        self.thread = Thread(target=self._check_time)
         self.paused = False
         self.running = False
+        self._generation = 0
 
     def set(self, timespan: timedelta) -> None:
-        self.datetime_end = datetime.now() + timespan
+        self.deadline = time.monotonic() + timespan.total_seconds()
         self.paused = False
         self.running = True
-        self.thread = Thread(target=self._check_time)
-        self.thread.start()
+        self._generation += 1
+        _timer_queue.schedule(self, self.deadline)
 
     def pause(self) -> None:
         if self.running and not self.paused:
-            self.time_remaining = self.datetime_end - datetime.now()
+            self.time_remaining = self.deadline - time.monotonic()
             self.paused = True
+            self._generation += 1
 
     def resume(self) -> None:
         if self.running and self.paused:
-            self.datetime_end = datetime.now() + self.time_remaining
+            self.deadline = time.monotonic() + self.time_remaining
             self.paused = False
+            self._generation += 1
+            _timer_queue.schedule(self, self.deadline)
 
-    def _check_time(self) -> None:
-        while self.running:
-            if not self.paused and datetime.now() > self.datetime_end:
-                self.callback()
-                break
-            time.sleep(1)
+    def _fire(self, generation: int) -> None:
+        if generation != self._generation or not self.running or self.paused:
+            return
+        self.running = False
+        self.callback()
 
 
 class MeasurementScheduler:
@@ -88,6 +149,52 @@ class MeasurementScheduler:
         self.running = False
 
 
+class MeasurementLog:
+    """Column-wise store for the measurements of a running experiment.
+
+    Every field of `MeasuredDataAtTimePoint` gets its own array of doubles,
+    so a sample costs 15 * 8 bytes instead of 15 float objects and a record.
+    The arrays are preallocated for `capacity` samples and only grow once
+    that is exceeded.
+    """
+
+    _FIELDS = tuple(a.name for a in attrs.fields(MeasuredDataAtTimePoint))
+    _get_fields = attrgetter(*_FIELDS)
+    # Upper bound for preallocation, ~15 MiB
+    MAX_CAPACITY = 1 << 17
+
+    columns: tuple[array[float], ...]
+    _size: int
+
+    def __init__(self, capacity: int = 0) -> None:
+        capacity = max(0, min(capacity, self.MAX_CAPACITY))
+        self.columns = tuple(
+            array("d", bytes(8 * capacity)) for _ in self._FIELDS
+        )
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, sample: MeasuredDataAtTimePoint) -> None:
+        values = self._get_fields(sample)
+        i = self._size
+        if i < len(self.columns[0]):
+            for column, value in zip(self.columns, values, strict=True):
+                column[i] = value
+        else:
+            for column, value in zip(self.columns, values, strict=True):
+                column.append(value)
+        self._size = i + 1
+
+    def to_records(self) -> tuple[MeasuredDataAtTimePoint, ...]:
+        size = self._size
+        return tuple(
+            MeasuredDataAtTimePoint(*row)
+            for row in zip(*(c[:size] for c in self.columns), strict=True)
+        )
+
+
 class ExperimentRunner:
     controller: "Controller"
 
@@ -108,7 +215,7 @@ class ExperimentRunner:
     # Data of current experiment
     _template: ExperimentTemplate
     _lab_notebook_entry: str
-    _measurements: list[MeasuredDataAtTimePoint]
+    _measurements: MeasurementLog
     _events: list[EventPair]
     _canceled: bool
     _neighbours: list[int]
@@ -146,7 +253,7 @@ class ExperimentRunner:
         # Setup data collection
         self._template = template
         self._lab_notebook_entry = lab_notebook_entry
-        self._measurements = []
+        self._measurements = MeasurementLog(self._expected_measurements())
         self._events = []
         self._neighbours = []
         self._canceled = False
@@ -338,10 +445,25 @@ class ExperimentRunner:
             error_occured=self._error,
             experiment_cancelled=self._canceled,
             event_log=tuple(self._events),
-            measured_data=tuple(self._measurements),
+            measured_data=self._measurements.to_records(),
         )
         self.controller.end_experiment(self._lane, data)
 
+    def _expected_measurements(self) -> int:
+        """Number of samples the current template takes without pauses."""
+        interval = self._template.measurement_interval
+        if interval <= 0:
+            return 0
+        duration = max(
+            self._template.led_front_exposure_time
+            if self._template.led_front is not None
+            else 0,
+            self._template.led_back_exposure_time
+            if self._template.led_back is not None
+            else 0,
+        )
+        return int(duration / interval) + 1
+
     # Callbacks from timer
 
     def _sample(self) -> None:
@@ -452,7 +574,12 @@ class ExperimentSupervisor:
         template: ExperimentTemplate,
         uid: int,
         lab_notebook_entry: str,
-    ) -> None:
+    ) -> bool:
+        """Returns False if an active abort keeps the lane from starting."""
+        reason = self.controller.start_blocked_by(lane)
+        if reason is not None:
+            logger.warning(f"Not starting experiment on lane {lane}: {reason}")
+            return False
         logger.info(
             f"Stating experiment on lane {lane}"
             f" using template {template.get_uid()}"
@@ -470,6 +597,7 @@ class ExperimentSupervisor:
         self.controller.state.uv_installed = any(
             runners.has_uv() for runners in self.runners
         )
+        return True
 
     def pause_experiment_on(self, lane: LedLane) -> None:
         if not self.box_open:
@@ -504,6 +632,42 @@ class ExperimentSupervisor:
         logger.warning(f"Registered error on lane {lane}")
         self.runners[lane.demux(0, 1, 2)].register_error()
 
+    def add_event_on_all(self, event: str) -> None:
+        logger.debug(f"Event {event} on all lanes.")
+        for runner in self.runners:
+            runner.add_event(event)
+
+    def register_error_on_all(self) -> None:
+        logger.warning("Registered error on all lanes")
+        for runner in self.runners:
+            runner.register_error()
+
+    def abort_experiments_on(
+        self, lanes: Iterable[LedLane], event: str
+    ) -> None:
+        """Logs `event`, registers an error and cancels on each of `lanes`.
+
+        Lanes without a running experiment are skipped, so calling this
+        repeatedly while a fault persists only affects new experiments.
+        """
+        runners = [
+            runner
+            for lane in lanes
+            if (runner := self.runners[lane.value]).is_running
+        ]
+        if not runners:
+            return
+        logger.warning(f"Aborting on lanes {lanes}: {event}")
+        for runner in runners:
+            runner.add_event(event)
+            runner.register_error()
+            runner.cancel()
+
+    def cancel_all(self) -> None:
+        logger.debug("Canceling on all lanes.")
+        for runner in self.runners:
+            runner.cancel()
+
     def auto_pause_on_open_box(self) -> None:
         self.box_open = True
         for runner in self.runners:
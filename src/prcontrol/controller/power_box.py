@@ -60,7 +60,9 @@ class CaseLidState(Enum):
     CLOSED = 1
 
 
-@attrs.define(on_setattr=sensor_observer_callback_dispatcher)
+@attrs.define(
+    on_setattr=sensor_observer_callback_dispatcher, weakref_slot=False
+)
 class PowerBoxSensorState:
     abmient_temperature: Temperature
     voltage_total: Voltage
@@ -193,15 +195,65 @@ class PowerBoxStatusLeds(StatusLeds):
     led_warning_water = StatusLeds.led(_CHAN_LED_WARNING_WATER)
     led_boxes_closed = StatusLeds.led(_CHAN_LED_BOXES_CLOSED)
 
-    def is_output_channel(self, channel: int) -> bool:
-        return channel in {
-            self._CHAN_LED_WARNING_TEMP_AMBIENT,
-            self._CHAN_LED_MAINTENANCE_ACTIVE,
-            self._CHAN_LED_CONNECTED,
-            self._CHAN_LED_WARNING_VOLTAGE,
-            self._CHAN_LED_WARNING_WATER,
-            self._CHAN_LED_BOXES_CLOSED,
+    _OUTPUT_CHANNELS = frozenset(
+        {
+            _CHAN_LED_WARNING_TEMP_AMBIENT,
+            _CHAN_LED_MAINTENANCE_ACTIVE,
+            _CHAN_LED_CONNECTED,
+            _CHAN_LED_WARNING_VOLTAGE,
+            _CHAN_LED_WARNING_WATER,
+            _CHAN_LED_BOXES_CLOSED,
         }
+    )
+
+    def is_output_channel(self, channel: int) -> bool:
+        return channel in self._OUTPUT_CHANNELS
+
+
+# Sensor field set by each input channel,
+# with the values stored for a low and a high input
+_INPUT_FIELDS: dict[int, tuple[str, tuple[object, object]]] = {
+    PowerBoxStatusLeds._CHAN_INPUT_POWERBOX_CLOSED: (
+        "powerbox_lid",
+        (CaseLidState.CLOSED, CaseLidState.OPEN),
+    ),
+    PowerBoxStatusLeds._CHAN_INPUT_REACTORBOX_CLOSED: (
+        "reactorbox_lid",
+        (CaseLidState.CLOSED, CaseLidState.OPEN),
+    ),
+    PowerBoxStatusLeds._CHAN_INPUT_LED_INSTALLED_LANE_1_FRONT_AND_VIAL: (
+        "led_installed_lane_1_front_and_vial",
+        (False, True),
+    ),
+    PowerBoxStatusLeds._CHAN_INPUT_LED_INSTALLED_LANE_1_BACK: (
+        "led_installed_lane_1_back",
+        (False, True),
+    ),
+    PowerBoxStatusLeds._CHAN_INPUT_LED_INSTALLED_LANE_2_FRONT_AND_VIAL: (
+        "led_installed_lane_2_front_and_vial",
+        (False, True),
+    ),
+    PowerBoxStatusLeds._CHAN_INPUT_LED_INSTALLED_LANE_2_BACK: (
+        "led_installed_lane_2_back",
+        (False, True),
+    ),
+    PowerBoxStatusLeds._CHAN_INPUT_LED_INSTALLED_LANE_3_FRONT_AND_VIAL: (
+        "led_installed_lane_3_front_and_vial",
+        (False, True),
+    ),
+    PowerBoxStatusLeds._CHAN_INPUT_LED_INSTALLED_LANE_3_BACK: (
+        "led_installed_lane_3_back",
+        (False, True),
+    ),
+    PowerBoxStatusLeds._CHAN_INPUT_WATER_DETECTED: (
+        "water_detected",
+        (True, False),
+    ),
+    PowerBoxStatusLeds._CHAN_INPUT_CABLE_CONTROL: (
+        "cable_control",
+        (False, True),
+    ),
+}
 
 
 class PowerBox:
@@ -242,6 +294,12 @@ class PowerBox:
         self._callback_io16_all_inputs(  # bootstrap values
             [True] * 16, self.bricklets.io.get_value()
         )
+        # The bricklet acknowledges this setter by default, don't wait
+        # for one round trip per input channel
+        self.bricklets.io.set_response_expected(
+            BrickletIO16V2.FUNCTION_SET_INPUT_VALUE_CALLBACK_CONFIGURATION,
+            False,
+        )
         for channel in range(16):
             # We set value_has_to_change to True because
             # we don't want to log this kind of information
@@ -250,72 +308,74 @@ class PowerBox:
                     channel, self.sensor_period_ms, True
                 )
 
+        # Like the io channels, sensors only report changed values,
+        # the last reading stays in `self.sensors` meanwhile.
+        # None of the callback configurations waits for its acknowledgement.
         self.bricklets.temperature.register_callback(
             BrickletTemperatureV2.CALLBACK_TEMPERATURE,
             self._callback_temperature,
         )
+        self.bricklets.temperature.set_response_expected(
+            BrickletTemperatureV2.FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION,
+            False,
+        )
         self.bricklets.temperature.set_temperature_callback_configuration(
-            self.sensor_period_ms, False, "x", 0, 0
+            self.sensor_period_ms, True, "x", 0, 0
         )
 
-        vc_bricklets_and_lanes: list[
-            tuple[BrickletVoltageCurrentV2, BrickletVoltageCurrentV2, LedLane]
-        ] = [
+        # Each lane bricklet with its voltage and current sensor fields
+        vc_bricklets: list[tuple[BrickletVoltageCurrentV2, str, str]] = [
             (
                 self.bricklets.voltage_current_1f,
+                "voltage_lane_1_front",
+                "current_lane_1_front",
+            ),
+            (
                 self.bricklets.voltage_current_1b,
-                LedLane.LANE_1,
+                "voltage_lane_1_back",
+                "current_lane_1_back",
             ),
             (
                 self.bricklets.voltage_current_2f,
+                "voltage_lane_2_front",
+                "current_lane_2_front",
+            ),
+            (
                 self.bricklets.voltage_current_2b,
-                LedLane.LANE_2,
+                "voltage_lane_2_back",
+                "current_lane_2_back",
             ),
             (
                 self.bricklets.voltage_current_3f,
+                "voltage_lane_3_front",
+                "current_lane_3_front",
+            ),
+            (
                 self.bricklets.voltage_current_3b,
-                LedLane.LANE_3,
+                "voltage_lane_3_back",
+                "current_lane_3_back",
             ),
         ]
-        for bricklet_front, bricklet_back, lane in vc_bricklets_and_lanes:
-            bricklet_front.register_callback(
-                BrickletVoltageCurrentV2.CALLBACK_CURRENT,
-                partial(
-                    self._callback_lane_current,
-                    LedPosition(lane, LedSide.FRONT),
-                ),
-            )
-            bricklet_back.register_callback(
+        vc_callback_configurations = (
+            BrickletVoltageCurrentV2.FUNCTION_SET_CURRENT_CALLBACK_CONFIGURATION,
+            BrickletVoltageCurrentV2.FUNCTION_SET_VOLTAGE_CALLBACK_CONFIGURATION,
+        )
+        for vc_bricklet, voltage_field, current_field in vc_bricklets:
+            vc_bricklet.register_callback(
                 BrickletVoltageCurrentV2.CALLBACK_CURRENT,
-                partial(
-                    self._callback_lane_current, LedPosition(lane, LedSide.BACK)
-                ),
-            )
-            bricklet_front.register_callback(
-                BrickletVoltageCurrentV2.CALLBACK_VOLTAGE,
-                partial(
-                    self._callback_lane_voltage,
-                    LedPosition(lane, LedSide.FRONT),
-                ),
+                partial(self._callback_lane_current, current_field),
             )
-            bricklet_back.register_callback(
+            vc_bricklet.register_callback(
                 BrickletVoltageCurrentV2.CALLBACK_VOLTAGE,
-                partial(
-                    self._callback_lane_voltage, LedPosition(lane, LedSide.BACK)
-                ),
+                partial(self._callback_lane_voltage, voltage_field),
             )
-
-            bricklet_front.set_current_callback_configuration(
-                self.sensor_period_ms, False, "x", 0, 0
+            for function_id in vc_callback_configurations:
+                vc_bricklet.set_response_expected(function_id, False)
+            vc_bricklet.set_current_callback_configuration(
+                self.sensor_period_ms, True, "x", 0, 0
             )
-            bricklet_back.set_current_callback_configuration(
-                self.sensor_period_ms, False, "x", 0, 0
-            )
-            bricklet_front.set_voltage_callback_configuration(
-                self.sensor_period_ms, False, "x", 0, 0
-            )
-            bricklet_back.set_voltage_callback_configuration(
-                self.sensor_period_ms, False, "x", 0, 0
+            vc_bricklet.set_voltage_callback_configuration(
+                self.sensor_period_ms, True, "x", 0, 0
             )
 
         self.bricklets.voltage_current_total.register_callback(
@@ -326,11 +386,15 @@ class PowerBox:
             BrickletVoltageCurrentV2.CALLBACK_VOLTAGE,
             self._callback_total_voltage,
         )
+        for function_id in vc_callback_configurations:
+            self.bricklets.voltage_current_total.set_response_expected(
+                function_id, False
+            )
         self.bricklets.voltage_current_total.set_current_callback_configuration(
-            self.sensor_period_ms, False, "x", 0, 0
+            self.sensor_period_ms, True, "x", 0, 0
         )
         self.bricklets.voltage_current_total.set_voltage_callback_configuration(
-            self.sensor_period_ms, False, "x", 0, 0
+            self.sensor_period_ms, True, "x", 0, 0
         )
 
         self.io_panel.led_warning_temp_ambient = LedState.HIGH
@@ -363,28 +427,10 @@ class PowerBox:
         value: bool,
     ) -> None:
         # TODO: maybe some of these are acitve low.
-        s = self.sensors
-        io = self.io_panel
-        if chan == io._CHAN_INPUT_POWERBOX_CLOSED:
-            s.powerbox_lid = [CaseLidState.CLOSED, CaseLidState.OPEN][value]
-        elif chan == io._CHAN_INPUT_REACTORBOX_CLOSED:
-            s.reactorbox_lid = [CaseLidState.CLOSED, CaseLidState.OPEN][value]
-        elif chan == io._CHAN_INPUT_LED_INSTALLED_LANE_1_FRONT_AND_VIAL:
-            s.led_installed_lane_1_front_and_vial = value
-        elif chan == io._CHAN_INPUT_LED_INSTALLED_LANE_1_BACK:
-            s.led_installed_lane_1_back = value
-        elif chan == io._CHAN_INPUT_LED_INSTALLED_LANE_2_FRONT_AND_VIAL:
-            s.led_installed_lane_2_front_and_vial = value
-        elif chan == io._CHAN_INPUT_LED_INSTALLED_LANE_2_BACK:
-            s.led_installed_lane_2_back = value
-        elif chan == io._CHAN_INPUT_LED_INSTALLED_LANE_3_FRONT_AND_VIAL:
-            s.led_installed_lane_3_front_and_vial = value
-        elif chan == io._CHAN_INPUT_LED_INSTALLED_LANE_3_BACK:
-            s.led_installed_lane_3_back = value
-        elif chan == io._CHAN_INPUT_WATER_DETECTED:
-            s.water_detected = not value
-        elif chan == io._CHAN_INPUT_CABLE_CONTROL:
-            s.cable_control = value
+        entry = _INPUT_FIELDS.get(chan)
+        if entry is not None:
+            field_name, values = entry
+            setattr(self.sensors, field_name, values[value])
 
     def _callback_io16_all_inputs(
         self, changes: list[bool], vals: list[bool]
@@ -397,37 +443,11 @@ class PowerBox:
             hundreth_celsius
         )
 
-    def _callback_lane_voltage(self, led: LedPosition, voltage: int) -> None:
-        s = self.sensors
-        match led:
-            case LedPosition(LedLane.LANE_1, LedSide.FRONT):
-                s.voltage_lane_1_front = Voltage.from_milli_volts(voltage)
-            case LedPosition(LedLane.LANE_1, LedSide.BACK):
-                s.voltage_lane_1_back = Voltage.from_milli_volts(voltage)
-            case LedPosition(LedLane.LANE_2, LedSide.FRONT):
-                s.voltage_lane_2_front = Voltage.from_milli_volts(voltage)
-            case LedPosition(LedLane.LANE_2, LedSide.BACK):
-                s.voltage_lane_2_back = Voltage.from_milli_volts(voltage)
-            case LedPosition(LedLane.LANE_3, LedSide.FRONT):
-                s.voltage_lane_3_front = Voltage.from_milli_volts(voltage)
-            case LedPosition(LedLane.LANE_3, LedSide.BACK):
-                s.voltage_lane_3_back = Voltage.from_milli_volts(voltage)
+    def _callback_lane_voltage(self, field_name: str, voltage: int) -> None:
+        setattr(self.sensors, field_name, Voltage.from_milli_volts(voltage))
 
-    def _callback_lane_current(self, led: LedPosition, current: int) -> None:
-        s = self.sensors
-        match led:
-            case LedPosition(LedLane.LANE_1, LedSide.FRONT):
-                s.current_lane_1_front = Current.from_milli_amps(current)
-            case LedPosition(LedLane.LANE_1, LedSide.BACK):
-                s.current_lane_1_back = Current.from_milli_amps(current)
-            case LedPosition(LedLane.LANE_2, LedSide.FRONT):
-                s.current_lane_2_front = Current.from_milli_amps(current)
-            case LedPosition(LedLane.LANE_2, LedSide.BACK):
-                s.current_lane_2_back = Current.from_milli_amps(current)
-            case LedPosition(LedLane.LANE_3, LedSide.FRONT):
-                s.current_lane_3_front = Current.from_milli_amps(current)
-            case LedPosition(LedLane.LANE_3, LedSide.BACK):
-                s.current_lane_3_back = Current.from_milli_amps(current)
+    def _callback_lane_current(self, field_name: str, current: int) -> None:
+        setattr(self.sensors, field_name, Current.from_milli_amps(current))
 
     def _callback_total_voltage(self, voltage: int) -> None:
         self.sensors.voltage_total = Voltage.from_milli_volts(voltage)
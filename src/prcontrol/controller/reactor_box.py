@@ -14,8 +14,8 @@ from tinkerforge.bricklet_thermocouple_v2 import BrickletThermocoupleV2
 from tinkerforge.bricklet_uv_light_v2 import BrickletUVLightV2
 
 from prcontrol.controller.common import (
+    DISPATCH_REPEATS,
     BrickletManager,
-    LedLane,
     LedState,
     SensorObserver,
     StatusLeds,
@@ -39,14 +39,17 @@ class ReactorBoxBricklets(BrickletManager):
     # fmt: on
 
 
-@attrs.define(on_setattr=sensor_observer_callback_dispatcher)
+@attrs.define(
+    on_setattr=sensor_observer_callback_dispatcher, weakref_slot=False
+)
 class ReactorBoxSensorState:
-    thermocouble_temp: Temperature
+    # The temperature observers hold their aborts while a reading repeats
+    thermocouble_temp: Temperature = attrs.field(metadata=DISPATCH_REPEATS)
     ambient_light: Illuminance
-    ambient_temperature: Temperature
-    lane_1_ir_temp: Temperature
-    lane_2_ir_temp: Temperature
-    lane_3_ir_temp: Temperature
+    ambient_temperature: Temperature = attrs.field(metadata=DISPATCH_REPEATS)
+    lane_1_ir_temp: Temperature = attrs.field(metadata=DISPATCH_REPEATS)
+    lane_2_ir_temp: Temperature = attrs.field(metadata=DISPATCH_REPEATS)
+    lane_3_ir_temp: Temperature = attrs.field(metadata=DISPATCH_REPEATS)
     uv_index: UvIndex
     lane_1_sample_taken: bool
     lane_2_sample_taken: bool
@@ -96,20 +99,24 @@ class ReactorBoxStatusLeds(StatusLeds):
     _CHAN_INPUT_MAINTENANCE_MODE = 14
     _CHAN_INPUT_CABLE_CONTROL = 15
 
-    def is_output_channel(self, channel: int) -> bool:
-        return channel in {
-            self._CHAN_LED_STATE_LANE_1,
-            self._CHAN_LED_STATE_LANE_2,
-            self._CHAN_LED_STATE_LANE_3,
-            self._CHAN_LED_UV_INSTALLED,
-            self._CHAN_LED_UV_WARNING,
-            self._CHAN_LED_EXPERIMENT_RUNNING,
-            self._CHAN_LED_WARNING_TEMP_LANE_1,
-            self._CHAN_LED_WARNING_TEMP_LANE_2,
-            self._CHAN_LED_WARNING_TEMP_LANE_3,
-            self._CHAN_LED_WARNING_TEMP_AMBIENT,
-            self._CHAN_LED_WARNING_THERMOCOUPLE,
+    _OUTPUT_CHANNELS = frozenset(
+        {
+            _CHAN_LED_STATE_LANE_1,
+            _CHAN_LED_STATE_LANE_2,
+            _CHAN_LED_STATE_LANE_3,
+            _CHAN_LED_UV_INSTALLED,
+            _CHAN_LED_UV_WARNING,
+            _CHAN_LED_EXPERIMENT_RUNNING,
+            _CHAN_LED_WARNING_TEMP_LANE_1,
+            _CHAN_LED_WARNING_TEMP_LANE_2,
+            _CHAN_LED_WARNING_TEMP_LANE_3,
+            _CHAN_LED_WARNING_TEMP_AMBIENT,
+            _CHAN_LED_WARNING_THERMOCOUPLE,
         }
+    )
+
+    def is_output_channel(self, channel: int) -> bool:
+        return channel in self._OUTPUT_CHANNELS
 
     led_state_lane_1 = StatusLeds.led(_CHAN_LED_STATE_LANE_1)
     led_state_lane_2 = StatusLeds.led(_CHAN_LED_STATE_LANE_2)
@@ -124,6 +131,32 @@ class ReactorBoxStatusLeds(StatusLeds):
     led_warning_thermocouple = StatusLeds.led(_CHAN_LED_WARNING_THERMOCOUPLE)
 
 
+# Sensor field set by each input channel,
+# with the values stored for a low and a high input
+_INPUT_FIELDS: dict[int, tuple[str, tuple[bool, bool]]] = {
+    ReactorBoxStatusLeds._CHAN_INPUT_SAMPLE_LANE_1: (
+        "lane_1_sample_taken",
+        (True, False),
+    ),
+    ReactorBoxStatusLeds._CHAN_INPUT_SAMPLE_LANE_2: (
+        "lane_2_sample_taken",
+        (True, False),
+    ),
+    ReactorBoxStatusLeds._CHAN_INPUT_SAMPLE_LANE_3: (
+        "lane_3_sample_taken",
+        (True, False),
+    ),
+    ReactorBoxStatusLeds._CHAN_INPUT_MAINTENANCE_MODE: (
+        "maintenance_mode",
+        (False, True),
+    ),
+    ReactorBoxStatusLeds._CHAN_INPUT_CABLE_CONTROL: (
+        "cable_control",
+        (False, True),
+    ),
+}
+
+
 class ReactorBox:
     bricklets: ReactorBoxBricklets
     sensor_period_ms: int
@@ -146,11 +179,19 @@ class ReactorBox:
     def initialize(self) -> Self:
         """Register the callbacks and set i/o direction."""
 
-        # register callbacks for all sensors and the io bricklet
+        # register callbacks for all sensors and the io bricklet.
+        # Like the io channels, most sensors only report changed values,
+        # the last reading stays in `self.sensors` meanwhile. The
+        # temperatures that can abort experiments report every period.
+        # None of the callback configurations waits for its acknowledgement.
         self.bricklets.thermocouple.register_callback(
             BrickletThermocoupleV2.CALLBACK_TEMPERATURE,
             self._callback_thermocouple,
         )
+        self.bricklets.thermocouple.set_response_expected(
+            BrickletThermocoupleV2.FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION,
+            False,
+        )
         self.bricklets.thermocouple.set_temperature_callback_configuration(
             self.sensor_period_ms, False, "x", 0, 0
         )
@@ -163,6 +204,12 @@ class ReactorBox:
         self._callback_io16_all_inputs(  # bootstrap values
             [True] * 16, self.bricklets.io.get_value()
         )
+        # The bricklet acknowledges this setter by default, don't wait
+        # for one round trip per input channel
+        self.bricklets.io.set_response_expected(
+            BrickletIO16V2.FUNCTION_SET_INPUT_VALUE_CALLBACK_CONFIGURATION,
+            False,
+        )
         for channel in range(16):
             # We set value_has_to_change to True because
             # we don'- want to log this kind of information
@@ -175,26 +222,38 @@ class ReactorBox:
             BrickletAmbientLightV3.CALLBACK_ILLUMINANCE,
             self._callback_ambient_light,
         )
+        self.bricklets.ambient_light.set_response_expected(
+            BrickletAmbientLightV3.FUNCTION_SET_ILLUMINANCE_CALLBACK_CONFIGURATION,
+            False,
+        )
         self.bricklets.ambient_light.set_illuminance_callback_configuration(
-            self.sensor_period_ms, False, "x", 0, 0
+            self.sensor_period_ms, True, "x", 0, 0
         )
 
         self.bricklets.temperature.register_callback(
             BrickletTemperatureV2.CALLBACK_TEMPERATURE,
             self._callback_temperature,
         )
+        self.bricklets.temperature.set_response_expected(
+            BrickletTemperatureV2.FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION,
+            False,
+        )
         self.bricklets.temperature.set_temperature_callback_configuration(
             self.sensor_period_ms, False, "x", 0, 0
         )
 
-        for sensor, lane in (
-            (self.bricklets.lane_1_temp_ir, LedLane.LANE_1),
-            (self.bricklets.lane_2_temp_ir, LedLane.LANE_2),
-            (self.bricklets.lane_3_temp_ir, LedLane.LANE_3),
+        for sensor, field_name in (
+            (self.bricklets.lane_1_temp_ir, "lane_1_ir_temp"),
+            (self.bricklets.lane_2_temp_ir, "lane_2_ir_temp"),
+            (self.bricklets.lane_3_temp_ir, "lane_3_ir_temp"),
         ):
             sensor.register_callback(
                 BrickletTemperatureIRV2.CALLBACK_OBJECT_TEMPERATURE,
-                partial(self._callback_temperature_ir, lane),
+                partial(self._callback_temperature_ir, field_name),
+            )
+            sensor.set_response_expected(
+                BrickletTemperatureIRV2.FUNCTION_SET_OBJECT_TEMPERATURE_CALLBACK_CONFIGURATION,
+                False,
             )
             sensor.set_object_temperature_callback_configuration(
                 self.sensor_period_ms, False, "x", 0, 0
@@ -203,8 +262,11 @@ class ReactorBox:
         self.bricklets.uv_light.register_callback(
             BrickletUVLightV2.CALLBACK_UVA, self._callback_uv_light
         )
+        self.bricklets.uv_light.set_response_expected(
+            BrickletUVLightV2.FUNCTION_SET_UVA_CALLBACK_CONFIGURATION, False
+        )
         self.bricklets.uv_light.set_uva_callback_configuration(
-            self.sensor_period_ms, False, "x", 0, 0
+            self.sensor_period_ms, True, "x", 0, 0
         )
 
         # set all status leds to their default value
@@ -232,16 +294,10 @@ class ReactorBox:
         changed: bool,
         value: bool,
     ) -> None:
-        if channel == self.io_panel._CHAN_INPUT_SAMPLE_LANE_1:
-            self.sensors.lane_1_sample_taken = not value
-        elif channel == self.io_panel._CHAN_INPUT_SAMPLE_LANE_2:
-            self.sensors.lane_2_sample_taken = not value
-        elif channel == self.io_panel._CHAN_INPUT_SAMPLE_LANE_3:
-            self.sensors.lane_3_sample_taken = not value
-        elif channel == self.io_panel._CHAN_INPUT_MAINTENANCE_MODE:
-            self.sensors.maintenance_mode = value
-        elif channel == self.io_panel._CHAN_INPUT_CABLE_CONTROL:
-            self.sensors.cable_control = value
+        entry = _INPUT_FIELDS.get(channel)
+        if entry is not None:
+            field_name, values = entry
+            setattr(self.sensors, field_name, values[value])
 
     def _callback_io16_all_inputs(
         self, changes: list[bool], vals: list[bool]
@@ -258,20 +314,13 @@ class ReactorBox:
         )
 
     def _callback_temperature_ir(
-        self, lane: LedLane, tenth_celsius: int
+        self, field_name: str, tenth_celsius: int
     ) -> None:
-        if lane == LedLane.LANE_1:
-            self.sensors.lane_1_ir_temp = Temperature.from_tenth_celsius(
-                tenth_celsius
-            )
-        if lane == LedLane.LANE_2:
-            self.sensors.lane_2_ir_temp = Temperature.from_tenth_celsius(
-                tenth_celsius
-            )
-        if lane == LedLane.LANE_3:
-            self.sensors.lane_3_ir_temp = Temperature.from_tenth_celsius(
-                tenth_celsius
-            )
+        setattr(
+            self.sensors,
+            field_name,
+            Temperature.from_tenth_celsius(tenth_celsius),
+        )
 
     def _callback_uv_light(self, tenth_uv_index: int) -> None:
         self.sensors.uv_index = UvIndex(tenth_uvi=tenth_uv_index)
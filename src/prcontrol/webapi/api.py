@@ -1,8 +1,9 @@
-import json
 import logging
+from threading import Lock
 from time import sleep
 from typing import Any
 
+import orjson
 from flask import Flask, Request, request
 from flask.typing import ResponseReturnValue
 from flask_cors import CORS
@@ -31,7 +32,9 @@ def create_app(
     global config_manager, controller
     app = Flask(__name__)
     CORS(app)
-    socketio = SocketIO(app, cors_allowed_origins="*")
+    # The threading worker keeps the Tinkerforge callback threads untouched,
+    # native WebSocket transport is provided by simple-websocket.
+    socketio = SocketIO(app, cors_allowed_origins="*", async_mode="threading")
 
     config_manager = ConfigManager()
 
@@ -125,7 +128,7 @@ def create_app(
 
             try:
                 config = folder.load(uid)
-                return config.to_json(), 200
+                return config.to_json_bytes(), 200
             except FileNotFoundError:
                 return "file does not exist", 400
 
@@ -157,7 +160,7 @@ def create_app(
             for config_object in folder.load_all()
         ]
 
-        return json.dumps({"results": list_of_configs}), 200
+        return orjson.dumps({"results": list_of_configs}), 200
 
     # Routes for Experiments
 
@@ -203,9 +206,10 @@ def create_app(
 
         uid = config_manager.experiments.next_uid()
 
-        controller.experiment_supervisor.start_experiment_on(
+        if not controller.experiment_supervisor.start_experiment_on(
             lane, template, uid, lab_notebook_entry
-        )
+        ):
+            return "a temperature abort is active on this lane", 409
         return "experiment was started", 200
 
     @app.route("/pause_experiment", methods=["GET"])
@@ -272,14 +276,22 @@ def create_app(
         return "canceled experiment", 200
 
     # Websocket part:
+    # A single background task broadcasts to all clients,
+    # it is started when the first client connects.
+    broadcast_lock = Lock()
+    broadcast_started = False
+
     @socketio.on("connect")
     def handle_connect() -> None:
-        socketio.start_background_task(target=send_data)
+        nonlocal broadcast_started
+        with broadcast_lock:
+            if not broadcast_started:
+                socketio.start_background_task(target=send_data)
+                broadcast_started = True
         logger.debug("WebSocker client connected.")
 
     @socketio.on("disconnect")
     def handle_disconnect() -> None:
-        socketio.start_background_task(target=send_data)
         logger.debug("WebSocket client disconnected.")
 
     def send_data() -> None:
@@ -1,11 +1,13 @@
 import os
 import pathlib
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import attrs
 import pytest
 
-from prcontrol.controller.config_manager import ConfigFolder
+from prcontrol.controller.config_manager import ConfigFolder, ConfigManager
 from prcontrol.controller.configuration import ConfigObject
 
 
@@ -112,3 +114,101 @@ def test_deleting_not_existing_json(dir_path):
 def test_list_all_json(dir_path):
     dir = init_test_folder(5, dir_path)
     assert len(list(dir.load_all())) == 5
+
+
+def test_list_all_json_in_uid_order(dir_path):
+    for count in (2, 12):
+        dir = init_test_folder(count, os.path.join(dir_path, str(count)))
+        uids = [obj.get_uid() for obj in dir.load_all()]
+        assert uids == list(range(count))
+
+
+def test_loading_cached_json(dir_path):
+    dir = init_test_folder(1, dir_path)
+    assert dir.load(0) is dir.load(0)
+
+
+def test_loading_externally_modified_json(dir_path):
+    dir = init_test_folder(1, dir_path)
+    _ = dir.load(0)
+    path = dir.workspace / "obj_0.json"
+    path.write_text(MyConfigTestObject(0, "modified").to_json())
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert dir.load(0).name == "modified"
+
+
+def test_adding_many_json(dir_path):
+    dir = init_test_folder(2, dir_path)
+    dir.add_many(
+        MyConfigTestObject(uid=i, name=f"batch_obj_{i}") for i in range(1, 4)
+    )
+    assert len(dir._configs) == 4
+    assert sorted(os.listdir(dir.workspace)) == [
+        f"obj_{i}.json" for i in range(4)
+    ]
+    assert dir.load(1).name == "batch_obj_1"
+
+
+def test_adding_many_json_with_repeated_uid(dir_path):
+    dir = init_test_folder(1, dir_path)
+    dir.add_many(
+        [
+            MyConfigTestObject(uid=1, name="first"),
+            MyConfigTestObject(uid=2, name="other"),
+            MyConfigTestObject(uid=1, name="last"),
+        ]
+    )
+    assert sorted(os.listdir(dir.workspace)) == [
+        f"obj_{i}.json" for i in range(3)
+    ]
+    assert dir.load(1).name == "last"
+
+
+def test_adding_many_json_cleans_up_on_failure(dir_path):
+    dir = init_test_folder(1, dir_path)
+
+    def objects():
+        yield MyConfigTestObject(uid=1, name="batch_obj_1")
+        raise OSError("disk full")
+
+    with pytest.raises(OSError):
+        dir.add_many(objects())
+    assert os.listdir(dir.workspace) == ["obj_0.json"]
+    assert dir._configs == {0}
+
+
+def test_ignoring_foreign_files(dir_path):
+    wrk_spc = init_test_folder(2, dir_path).workspace
+    for name in ("obj_x.json", "obj_.json", "obj_1.json.tmp", "notes.txt"):
+        (wrk_spc / name).write_text("")
+    new_dir = ConfigFolder(wrk_spc, MyConfigTestObject)
+    assert new_dir._configs == {0, 1}
+
+
+def test_next_uid_per_folder(dir_path):
+    dir = init_test_folder(3, os.path.join(dir_path, "a"))
+    other = init_test_folder(0, os.path.join(dir_path, "b"))
+    assert dir.next_uid() == 3
+    assert dir.next_uid() == 4
+    assert other.next_uid() == 0
+
+
+def test_loading_large_json(dir_path, monkeypatch):
+    monkeypatch.setattr(ConfigFolder, "_MMAP_THRESHOLD", 0)
+    dir = init_test_folder(2, dir_path)
+    assert dir.load(1) == MyConfigTestObject(uid=1, name="default_obj_1")
+
+
+def test_config_manager_opens_folder_once(dir_path, monkeypatch):
+    update = ConfigFolder._update
+
+    def slow_update(self):
+        time.sleep(0.05)  # widen the window for a second first access
+        update(self)
+
+    monkeypatch.setattr(ConfigFolder, "_update", slow_update)
+    manager = ConfigManager(dir_path)
+    with ThreadPoolExecutor(4) as pool:
+        folders = list(pool.map(lambda _: manager.experiments, range(4)))
+    assert all(folder is folders[0] for folder in folders)
@@ -0,0 +1,87 @@
+from prcontrol.controller.common import LedLane, LedState
+from prcontrol.controller.config_manager import ConfigManager
+from prcontrol.controller.controller import Controller
+from prcontrol.controller.measurements import Temperature
+
+from .test_experiment import get_template_with
+
+
+class MockIO16:
+    """Accepts the LED writes of a status panel without hardware."""
+
+    def set_selected_value(self, channel, value):
+        pass
+
+    def set_monoflop(self, channel, value, time):
+        pass
+
+
+def mock_controller(tmp_path) -> Controller:
+    controller = Controller(
+        reactor_box=("localhost", 4223),
+        power_box=("localhost", 4224),
+        config_manager=ConfigManager(tmp_path),
+    )
+    for box in (controller.reactor_box, controller.power_box):
+        panel = box.io_panel
+        panel._bricklet = MockIO16()
+
+        # Like the real initialize, reset all status LEDs to their default
+        def initialize(panel=panel):
+            for name in dir(type(panel)):
+                if name.startswith("led_"):
+                    setattr(panel, name, LedState.HIGH)
+
+        box.initialize = initialize
+    controller.initialize()
+    return controller
+
+
+def test_reconnect_restores_fault_leds(tmp_path):
+    controller = mock_controller(tmp_path)
+    power_panel = controller.power_box.io_panel
+
+    controller.power_box.sensors.water_detected = True
+    assert power_panel.led_warning_water == LedState.BLINK_FAST
+
+    controller._callback_power_box_disconnected()
+    controller._callback_power_box_connected()
+    assert power_panel.led_warning_water == LedState.BLINK_FAST
+
+    reactor_panel = controller.reactor_box.io_panel
+    # Above the warning threshold of the default config
+    controller.reactor_box.sensors.lane_2_ir_temp = Temperature.from_celsius(32)
+    assert reactor_panel.led_warning_temp_lane_2 == LedState.BLINK_FAST
+
+    controller._callback_reactor_box_disconnected()
+    controller._callback_reactor_box_connected()
+    assert reactor_panel.led_warning_temp_lane_2 == LedState.BLINK_FAST
+
+
+def test_active_abort_blocks_experiment_start(tmp_path):
+    controller = mock_controller(tmp_path)
+    supervisor = controller.experiment_supervisor
+    sensors = controller.reactor_box.sensors
+    template = get_template_with(1.0, 0.0, (), 1.0)
+
+    # Above the thermocouple threshold, which affects all lanes by default
+    sensors.thermocouble_temp = Temperature.from_celsius(40)
+    assert not supervisor.start_experiment_on(LedLane.LANE_1, template, 1, "")
+    assert not supervisor.runners[0].is_running
+    sensors.thermocouble_temp = Temperature.from_celsius(20)
+    assert controller.start_blocked_by(LedLane.LANE_1) is None
+
+    # The IR abort only holds its own lane
+    sensors.lane_2_ir_temp = Temperature.from_celsius(40)
+    sensors.lane_2_ir_temp = Temperature.from_celsius(20)
+    assert not supervisor.start_experiment_on(LedLane.LANE_2, template, 2, "")
+    assert not supervisor.runners[1].is_running
+    assert controller.start_blocked_by(LedLane.LANE_3) is None
+    controller.reset_lane_ir_warnings()
+    assert controller.start_blocked_by(LedLane.LANE_2) is None
+
+    sensors.ambient_temperature = Temperature.from_celsius(40)
+    sensors.ambient_temperature = Temperature.from_celsius(20)
+    assert controller.start_blocked_by(LedLane.LANE_3) is not None
+    controller.reset_ambient_temp_warning()
+    assert controller.start_blocked_by(LedLane.LANE_3) is None
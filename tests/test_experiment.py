@@ -1,5 +1,6 @@
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
+from threading import Event
 from typing import Self
 
 from prcontrol.controller.common import LedLane, LedPosition, LedSide
@@ -9,9 +10,14 @@ from prcontrol.controller.configuration import (
     Experiment,
     ExperimentTemplate,
     HardwareConfig,
+    MeasuredDataAtTimePoint,
 )
 from prcontrol.controller.controller import ControllerState
-from prcontrol.controller.experiment import ExperimentSupervisor
+from prcontrol.controller.experiment import (
+    ExperimentSupervisor,
+    MeasurementLog,
+    Timer,
+)
 from prcontrol.controller.measurements import Current
 from prcontrol.controller.power_box import PowerBoxSensorState
 from prcontrol.controller.reactor_box import ReactorBoxSensorState
@@ -119,6 +125,9 @@ class MockController:
         self.logger = logger
         self.done = False
 
+    def start_blocked_by(self, lane: LedLane) -> str | None:
+        return None
+
     def experiment_started_running(self) -> None:
         return
 
@@ -425,6 +434,24 @@ def test_cancel():
     time.sleep(6)  # Wait for possible second finish call
 
 
+def test_abort_experiments_on():
+    logger = ExperimentLogger()
+    controller = MockController(logger, True)
+    template = get_template_with(10, 10, (), 1.0)
+    controller.supervisor.start_experiment_on(LedLane.LANE_1, template, 0, "")
+    time.sleep(1)
+    lanes = (LedLane.LANE_1, LedLane.LANE_2)
+    controller.supervisor.abort_experiments_on(lanes, "/Abort/")
+    controller.supervisor.abort_experiments_on(lanes, "/Abort/")
+    time.sleep(1)
+
+    assert_expirement_done(logger, LedLane.LANE_1)
+    data = logger.exp_data[LedLane.LANE_1]
+    assert data.error_occured
+    assert data.experiment_cancelled
+    assert [e.event for e in data.event_log].count("/Abort/") == 1
+
+
 def test_double_pause():
     logger = ExperimentLogger()
     controller = MockController(logger, True)
@@ -600,3 +627,41 @@ def test_close_close():
     controller.close_box()
     time.sleep(3)
     assert_expirement_done(logger, LedLane.LANE_1)
+
+
+def test_measurement_log_roundtrip():
+    log = MeasurementLog()
+    samples = tuple(
+        MeasuredDataAtTimePoint(*(float(i * 15 + j) for j in range(15)))
+        for i in range(3)
+    )
+    for sample in samples:
+        log.append(sample)
+    assert len(log) == 3
+    assert log.to_records() == samples
+
+
+def test_measurement_log_grows_past_capacity():
+    log = MeasurementLog(capacity=2)
+    samples = tuple(
+        MeasuredDataAtTimePoint(*(float(i) for _ in range(15)))
+        for i in range(5)
+    )
+    for sample in samples[:1]:
+        log.append(sample)
+    assert log.to_records() == samples[:1]
+    for sample in samples[1:]:
+        log.append(sample)
+    assert len(log) == 5
+    assert log.to_records() == samples
+
+
+def test_timer_survives_failing_callback():
+    def fail() -> None:
+        raise RuntimeError("bricklet unreachable")
+
+    fired = Event()
+    Timer(fail).set(timedelta(seconds=0.1))
+    time.sleep(0.3)
+    Timer(fired.set).set(timedelta(seconds=0.1))
+    assert fired.wait(2)
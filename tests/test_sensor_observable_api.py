@@ -3,7 +3,9 @@ from typing import Self
 import attrs
 
 from prcontrol.controller.common import (
+    DISPATCH_REPEATS,
     SensorObserver,
+    callable_field,
     sensor_observer_callback_dispatcher,
 )
 from prcontrol.controller.measurements import Temperature
@@ -70,3 +72,42 @@ def test_callback_lst():
     s.temp = Temperature.from_celsius(1)
 
     assert s == SensorState(True, Temperature.from_celsius(1))
+
+
+def test_unchanged_value_not_dispatched():
+    received_callbacks = []
+
+    def cb(*args):
+        received_callbacks.append(args)
+
+    s = SensorState(False, Temperature.from_celsius(0), callback=cb)
+
+    s.temp = Temperature.from_celsius(0)
+    s.button_pressed = False
+    s.button_pressed = True
+    s.button_pressed = True
+
+    assert len(received_callbacks) == 1
+    assert s == SensorState(True, Temperature.from_celsius(0))
+
+
+def test_dispatch_repeats_field():
+    @attrs.define(on_setattr=sensor_observer_callback_dispatcher)
+    class RepeatingState:
+        button_pressed: bool
+        temp: Temperature = attrs.field(metadata=DISPATCH_REPEATS)
+
+        callback: SensorObserver[Self] = callable_field()
+
+    received_callbacks = []
+
+    def cb(*args):
+        received_callbacks.append(args)
+
+    s = RepeatingState(False, Temperature.from_celsius(0), callback=cb)
+
+    s.button_pressed = False
+    s.temp = Temperature.from_celsius(0)
+    s.temp = Temperature.from_celsius(0)
+
+    assert len(received_callbacks) == 2